@@ -5,7 +5,7 @@ from config.settings import settings
 
 def get_database_url() -> str:
     """Get PostgreSQL connection string from environment."""
-    database_url = settings.get_postgres_conn_string()
+    database_url = settings.postgres_conn_string
 
     # AsyncPostgresSaver requires postgresql:// not postgresql+psycopg://
     if database_url.startswith("postgresql+psycopg://"):
@@ -1,6 +1,8 @@
 """SQLite database connectors for league databases."""
 
 import sqlite3
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +16,11 @@ LEAGUE_DBS = {
     "cebl": DB_DIR / "cebl.db",
 }
 
+# Per-thread read-only connections reused by execute_query/iter_query.
+# Bumping the generation (reset_connections) makes every thread reopen on its next query.
+_thread_local = threading.local()
+_connection_generation = 0
+
 
 def get_db_connection(league: str) -> sqlite3.Connection:
     """
@@ -43,6 +50,32 @@ def get_db_connection(league: str) -> sqlite3.Connection:
     return conn
 
 
+def _get_cached_connection(league: str) -> sqlite3.Connection:
+    """
+    Get this thread's connection to a league database, opening it on first use.
+
+    sqlite3 connections cannot be shared across threads by default, so each thread keeps
+    its own; prepared statements are cached per connection.
+    """
+    if getattr(_thread_local, "generation", None) != _connection_generation:
+        for conn in getattr(_thread_local, "connections", {}).values():
+            conn.close()
+        _thread_local.connections = {}
+        _thread_local.generation = _connection_generation
+
+    league = league.lower()
+    conn = _thread_local.connections.get(league)
+    if conn is None:
+        conn = _thread_local.connections[league] = get_db_connection(league)
+    return conn
+
+
+def reset_connections() -> None:
+    """Make every thread reopen its league connections (e.g. after the database files are replaced)."""
+    global _connection_generation
+    _connection_generation += 1
+
+
 def execute_query(league: str, query: str, params: tuple = ()) -> list[dict[str, Any]]:
     """
     Execute a read-only SQL query on a league database.
@@ -55,16 +88,29 @@ def execute_query(league: str, query: str, params: tuple = ()) -> list[dict[str,
     Returns:
         List of rows as dictionaries
     """
+    return list(iter_query(league, query, params))
+
+
+def iter_query(league: str, query: str, params: tuple = ()) -> Iterator[dict[str, Any]]:
+    """
+    Execute a read-only SQL query and yield rows as the cursor produces them.
+
+    Use instead of execute_query when rows are consumed in a single pass, so the
+    full result set is never held as sqlite3.Row objects.
+
+    Args:
+        league: League name
+        query: SQL query (SELECT only)
+        params: Query parameters (for parameterized queries)
+
+    Yields:
+        Rows as dictionaries
+    """
     if not query.strip().upper().startswith("SELECT"):
         raise ValueError("Only SELECT queries are allowed")
 
-    conn = get_db_connection(league)
-    try:
-        cursor = conn.execute(query, params)
-        rows = [dict(row) for row in cursor.fetchall()]
-        return rows
-    finally:
-        conn.close()
+    for row in _get_cached_connection(league).execute(query, params):
+        yield dict(row)
 
 
 def get_all_leagues() -> list[str]:
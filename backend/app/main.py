@@ -1,16 +1,45 @@
 """Main FastAPI application entry point."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 
+from config.logging import get_logger, setup_logging
 from config.settings import settings
 from graph.graph import build_graph
+from graph.tools.pdf_generator.pdf_generator import close_shared_browser, start_shared_browser
 
-from .routes import agent, auth, pages, pdf, search, sql
+from .routes import agent, auth, internal, pages, pdf, search, sql
+from .services.cache_service import CACHE_REWARM_INTERVAL, clear_stats_caches, warm_stats_caches
+
+setup_logging(settings.log_level)
+logger = get_logger(__name__)
+
+
+async def _warm_caches_periodically():
+    """Warm stats caches at startup, then clear and re-warm them daily."""
+    while True:
+        try:
+            warmed = await asyncio.to_thread(warm_stats_caches)
+            print(f"✅ Stats caches warmed: {warmed}")
+        except Exception:
+            logger.exception("Stats cache warm-up failed")
+
+        await asyncio.sleep(CACHE_REWARM_INTERVAL)
+        clear_stats_caches()
+
+
+async def _start_pdf_browser():
+    """Launch the shared PDF browser so the first scouting report doesn't pay Chromium's startup."""
+    try:
+        await start_shared_browser()
+        print("✅ PDF browser launched.")
+    except Exception:
+        logger.exception("PDF browser launch failed (will retry on first render)")
 
 
 @asynccontextmanager
@@ -33,7 +62,17 @@ async def lifespan(app: FastAPI):
 
             print("✅ AI scouting agent initialized successfully.")
 
-            yield
+            # Warm in the background so startup isn't blocked on SQLite scans
+            warm_task = asyncio.create_task(_warm_caches_periodically())
+            browser_task = asyncio.create_task(_start_pdf_browser())
+            try:
+                yield
+            finally:
+                warm_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await warm_task
+                await browser_task
+                await close_shared_browser()
     except Exception as e:
         print(f"🚨 Failed to initialize AI scouting agent: {e}")
         raise
@@ -83,6 +122,7 @@ app.include_router(search.router)
 app.include_router(pdf.router)
 app.include_router(pages.router)
 app.include_router(sql.router)
+app.include_router(internal.router)
 
 
 @app.get("/health", tags=["Health"])
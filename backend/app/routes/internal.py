@@ -0,0 +1,34 @@
+"""Internal maintenance endpoints (not part of the public API)."""
+
+import asyncio
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException
+
+from config.settings import settings
+
+from ..services.cache_service import clear_stats_caches, warm_stats_caches
+
+router = APIRouter(prefix="/internal", tags=["Internal"], include_in_schema=False)
+
+# Default from config/settings.py and the .env.example value; a deployment still using one has no real key
+_PLACEHOLDER_API_KEYS = {"", "dev-key-change-in-production", "your_api_key_here"}
+
+
+@router.post("/warm-cache")
+async def warm_cache(x_api_key: str = Header(..., alias="X-API-Key")):
+    """
+    Clear and re-warm the team stats / league distribution caches.
+
+    Call after refreshing the league databases so stale season data is dropped.
+    Disabled (503) until API_KEY is set to a non-placeholder value.
+    """
+    if settings.api_key in _PLACEHOLDER_API_KEYS:
+        raise HTTPException(status_code=503, detail="Cache warming is disabled: API_KEY is not configured")
+
+    if not secrets.compare_digest(x_api_key.encode(), settings.api_key.encode()):
+        raise HTTPException(status_code=401, detail="Invalid API key")
+
+    clear_stats_caches()
+    warmed = await asyncio.to_thread(warm_stats_caches)
+    return {"status": "ok", "warmed": warmed}
@@ -1,6 +1,5 @@
 """Endpoint to run raw SQL queries and manage database operations."""
 
-import ast
 import re
 from typing import Optional
 
@@ -15,7 +14,7 @@ from app.db.sqlite import (
 )
 from app.schemas import LeagueType
 from config.constants import DEFAULT_SEASON
-from graph.nodes.stats_lookup import get_db_connection
+from graph.nodes.stats_lookup import execute_sql, get_db_engine
 
 router = APIRouter(prefix="/api/data", tags=["Data & SQL"])
 
@@ -75,17 +74,8 @@ async def run_sql_query(data: SQLQueryInput):
     Execute a raw SQL query against a specified database.
     """
     try:
-        db = get_db_connection(data.db_name)
-        raw_results = db.run(data.sql_query, fetch="all", include_columns=True)
-
-        if isinstance(raw_results, str):
-            query_data = ast.literal_eval(raw_results)
-        elif isinstance(raw_results, list):
-            query_data = raw_results
-        else:
-            query_data = []
-
-        return query_data
+        # Native rows (list of dicts) rather than db.run's stringified result
+        return execute_sql(get_db_engine(data.db_name), data.sql_query)
     except Exception as e:
         # Return both clean and raw error messages for better UX
         raw_error = str(e)
@@ -8,6 +8,7 @@ from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
+from pydantic_core import to_json
 
 from app.schemas.agent import ChatInput
 from config.constants import (
@@ -23,6 +24,9 @@ from config.constants import (
     OUTPUT,
 )
 
+# NDJSON separators without the default padding spaces (search result lists repeat every key per player)
+_COMPACT = (",", ":")
+
 # TODO:
 # 1. Fix scouting report URL generation for production environment.
 # 2. Increase the vertical size/height of the generated scouting report PDF.
@@ -60,12 +64,13 @@ async def event_generator(chat_input: ChatInput, request: Request):
     try:
         async for event in graph.astream(user_input_state, config, stream_mode="updates"):
             for node_name, node_output in event.items():
-                yield (json.dumps({NODE: node_name, OUTPUT: jsonable_encoder(node_output)}) + "\n")
+                # Serialized in one pass by pydantic-core; jsonable_encoder only for types it can't handle
+                yield to_json({NODE: node_name, OUTPUT: node_output}, fallback=jsonable_encoder) + b"\n"
 
     except Exception as e:
         error_message = _get_error_message(e)
         print(f"[ERROR] {type(e).__name__}: {e}")
-        yield json.dumps({NODE: ERROR, OUTPUT: error_message}) + "\n"
+        yield json.dumps({NODE: ERROR, OUTPUT: error_message}, separators=_COMPACT) + "\n"
 
 
 def _get_error_message(exception: Exception) -> str:
@@ -0,0 +1,92 @@
+"""Cache warming for season-level stats lookups.
+
+Team stats and league distributions are memoized per (league, team, season) and
+(league, season). Warming them for each league's current season at startup
+removes the cold-start cost from the first player detail request.
+"""
+
+from config.logging import get_logger
+
+from ..db.sqlite import execute_query, get_all_leagues, reset_connections
+from .league_service import get_league_distributions
+from .search_service import ROSTER_CACHE_TTL, clear_roster_cache, warm_roster_cache
+from .team_service import get_team_stats
+
+logger = get_logger(__name__)
+
+# Seconds between scheduled re-warms (daily, after the nightly data refresh); rosters warmed here live one cycle
+CACHE_REWARM_INTERVAL = ROSTER_CACHE_TTL
+
+# (current season, teams in that season) per league, keyed the same way the detail services call the caches
+_CURRENT_SEASON_QUERIES = {
+    "usports": """
+        SELECT season, school as team
+        FROM player_stats
+        WHERE season = (SELECT MAX(season) FROM player_stats)
+        GROUP BY school
+    """,
+    "ccaa": """
+        SELECT season, school as team
+        FROM player_stats
+        WHERE season = (SELECT MAX(season) FROM player_stats)
+        GROUP BY school
+    """,
+    "cebl": """
+        SELECT season, team_name_en as team
+        FROM players
+        WHERE season = (SELECT MAX(season) FROM players)
+        GROUP BY team_name_en
+    """,
+    "hoopqueens": """
+        SELECT (SELECT MAX(season) FROM game) as season, name as team
+        FROM team
+    """,
+}
+
+
+def warm_stats_caches() -> dict[str, int]:
+    """
+    Populate the team stats and league distribution caches for every league's current season,
+    and load the search rosters so the first player search after startup or a refresh is warm.
+
+    Returns:
+        Mapping of league -> number of team stats entries warmed
+    """
+    warmed: dict[str, int] = {}
+
+    for league in get_all_leagues():
+        query = _CURRENT_SEASON_QUERIES.get(league)
+        if not query:
+            continue
+
+        try:
+            rows = execute_query(league, query)
+            if not rows:
+                continue
+
+            season = str(rows[0]["season"])
+            get_league_distributions(league, season)
+
+            for row in rows:
+                if row.get("team"):
+                    get_team_stats(league, row["team"], season)
+
+            warmed[league] = len(rows)
+        except Exception:
+            logger.exception("Error warming caches for %s", league)
+
+    warm_roster_cache()
+
+    return warmed
+
+
+def clear_stats_caches() -> None:
+    """Drop memoized team stats, distributions, search rosters and player details (e.g. after an ETL refresh)."""
+    # Imported here: graph.nodes.scout imports app.services, so a module-level import would be circular
+    from graph.nodes.scout import clear_player_detail_cache
+
+    reset_connections()
+    get_team_stats.cache_clear()
+    get_league_distributions.cache_clear()
+    clear_roster_cache()
+    clear_player_detail_cache()
@@ -0,0 +1,140 @@
+"""League-wide statistics service.
+
+This module provides season-level league averages and stat distributions,
+used for comparing a player against the rest of their league.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ..db.sqlite import execute_query
+
+
+@dataclass(frozen=True, slots=True)
+class LeagueDistributions:
+    """League averages and sorted per-player distributions for one season."""
+
+    ppg: float
+    rpg: float
+    apg: float
+    ts_pct: float | None
+    # Sorted ascending for percentile lookups
+    ppg_dist: tuple[float, ...]
+    rpg_dist: tuple[float, ...]
+    apg_dist: tuple[float, ...]
+    ts_pct_dist: tuple[float, ...] | None
+
+
+@lru_cache(maxsize=128)
+def get_league_distributions(league: str, season: str) -> LeagueDistributions | None:
+    """
+    Get league averages and distributions for PPG, RPG, APG, and TS% for a given season.
+
+    Results are cached per (league, season), so one query and one sort serve every player in that season.
+
+    Args:
+        league: League name (usports, ccaa, cebl, hoopqueens)
+        season: Season identifier (format varies by league)
+
+    Returns:
+        LeagueDistributions, or None if the league/season has no qualifying players
+    """
+    league = league.lower()
+
+    if league == "cebl":
+        # CEBL stores season as integer (e.g., 2024)
+        query = """
+            SELECT
+                CAST(points AS REAL) / games_played as ppg,
+                CAST(rebounds AS REAL) / games_played as rpg,
+                CAST(assists AS REAL) / games_played as apg,
+                CAST(points AS REAL) as total_points,
+                CAST(field_goals_attempted AS REAL) as total_fga,
+                CAST(free_throws_attempted AS REAL) as total_fta
+            FROM players
+            WHERE games_played > 5 AND season = ?
+        """
+        try:
+            season_int = int(season)
+        except (ValueError, TypeError):
+            return None
+        rows = execute_query(league, query, (season_int,))
+
+    elif league in ["usports", "ccaa"]:
+        # U SPORTS/CCAA stores season as string (e.g., "2024-25")
+        query = """
+            SELECT
+                CAST(total_points AS REAL) / games_played as ppg,
+                CAST(total_rebounds AS REAL) / games_played as rpg,
+                CAST(assists AS REAL) / games_played as apg,
+                CAST(total_points AS REAL) as total_points,
+                CAST(field_goal_attempted AS REAL) as total_fga,
+                CAST(free_throws_attempted AS REAL) as total_fta
+            FROM player_stats
+            WHERE games_played > 5 AND season = ? AND season_type = 'regular'
+        """
+        rows = execute_query(league, query, (season,))
+
+    elif league == "hoopqueens":
+        # HoopQueens stores season as integer (e.g., 2025)
+        query = """
+            SELECT
+                pb.player_id,
+                AVG(pb.points) as ppg,
+                AVG(pb.total_rebounds) as rpg,
+                AVG(pb.assists) as apg,
+                SUM(pb.points) as total_points,
+                SUM(pb.field_goals_attempted) as total_fga,
+                SUM(pb.free_throws_attempted) as total_fta,
+                COUNT(DISTINCT pb.game_id) as games_played
+            FROM playerboxscore pb
+            JOIN game g ON pb.game_id = g.id
+            WHERE g.season = ?
+            GROUP BY pb.player_id
+            HAVING games_played > 5
+        """
+        try:
+            season_int = int(season)
+        except (ValueError, TypeError):
+            return None
+        rows = execute_query(league, query, (season_int,))
+    else:
+        return None
+
+    if not rows:
+        return None
+
+    # Extract distributions
+    ppg_dist = [float(row.get("ppg", 0) or 0) for row in rows]
+    rpg_dist = [float(row.get("rpg", 0) or 0) for row in rows]
+    apg_dist = [float(row.get("apg", 0) or 0) for row in rows]
+
+    # Calculate TS% for each player and build distribution
+    ts_pct_dist = []
+    for row in rows:
+        total_points = row.get("total_points", 0) or 0
+        total_fga = row.get("total_fga", 0) or 0
+        total_fta = row.get("total_fta", 0) or 0
+
+        ts_denominator = 2 * (total_fga + 0.44 * total_fta)
+        if ts_denominator > 0:
+            ts_pct = total_points / ts_denominator
+            ts_pct_dist.append(float(ts_pct))
+
+    # Calculate averages
+    avg_ppg = sum(ppg_dist) / len(ppg_dist) if ppg_dist else 0
+    avg_rpg = sum(rpg_dist) / len(rpg_dist) if rpg_dist else 0
+    avg_apg = sum(apg_dist) / len(apg_dist) if apg_dist else 0
+    avg_ts_pct = sum(ts_pct_dist) / len(ts_pct_dist) if ts_pct_dist else None
+
+    # Distributions are sorted once here (the result is cached) so percentile lookups can binary search
+    return LeagueDistributions(
+        ppg=float(avg_ppg),
+        rpg=float(avg_rpg),
+        apg=float(avg_apg),
+        ts_pct=float(avg_ts_pct) if avg_ts_pct is not None else None,
+        ppg_dist=tuple(sorted(ppg_dist)),
+        rpg_dist=tuple(sorted(rpg_dist)),
+        apg_dist=tuple(sorted(apg_dist)),
+        ts_pct_dist=tuple(sorted(ts_pct_dist)) if ts_pct_dist else None,
+    )
@@ -6,8 +6,9 @@ from config.constants import MENS_LEAGUE, WOMENS_LEAGUE, LeagueCategory
 
 from ..db.sqlite import execute_query
 from ..schemas.player import PlayerDetail, PlayerSeasonStats, ShotAttempt, ShotChartData
+from .league_service import get_league_distributions
 from .stats_calculator import (
-    calculate_advanced_stats,
+    calculate_advanced_stats_batch,
     calculate_league_comparison,
     calculate_league_specific_stats,
     calculate_team_context_stats,
@@ -15,123 +16,16 @@ from .stats_calculator import (
 from .team_service import get_team_stats
 
 
-def _get_league_distributions(league: str, season: str) -> dict[str, Any] | None:
-    """
-    Get league averages and distributions for PPG, RPG, APG, and TS% for a given season.
-
-    Args:
-        league: League name (usports, ccaa, cebl, hoopqueens)
-        season: Season identifier (format varies by league)
-
-    Returns:
-        Dict with keys: ppg, rpg, apg, ts_pct (averages) and
-        ppg_dist, rpg_dist, apg_dist, ts_pct_dist (distributions)
-    """
-    league = league.lower()
-
-    if league == "cebl":
-        # CEBL stores season as integer (e.g., 2024)
-        query = """
-            SELECT
-                CAST(points AS REAL) / games_played as ppg,
-                CAST(rebounds AS REAL) / games_played as rpg,
-                CAST(assists AS REAL) / games_played as apg,
-                CAST(points AS REAL) as total_points,
-                CAST(field_goals_attempted AS REAL) as total_fga,
-                CAST(free_throws_attempted AS REAL) as total_fta
-            FROM players
-            WHERE games_played > 5 AND season = ?
-        """
-        try:
-            season_int = int(season)
-        except (ValueError, TypeError):
-            return None
-        rows = execute_query(league, query, (season_int,))
-
-    elif league in ["usports", "ccaa"]:
-        # U SPORTS/CCAA stores season as string (e.g., "2024-25")
-        query = """
-            SELECT
-                CAST(total_points AS REAL) / games_played as ppg,
-                CAST(total_rebounds AS REAL) / games_played as rpg,
-                CAST(assists AS REAL) / games_played as apg,
-                CAST(total_points AS REAL) as total_points,
-                CAST(field_goal_attempted AS REAL) as total_fga,
-                CAST(free_throws_attempted AS REAL) as total_fta
-            FROM player_stats
-            WHERE games_played > 5 AND season = ? AND season_type = 'regular'
-        """
-        rows = execute_query(league, query, (season,))
-
-    elif league == "hoopqueens":
-        # HoopQueens stores season as integer (e.g., 2025)
-        query = """
-            SELECT
-                pb.player_id,
-                AVG(pb.points) as ppg,
-                AVG(pb.total_rebounds) as rpg,
-                AVG(pb.assists) as apg,
-                SUM(pb.points) as total_points,
-                SUM(pb.field_goals_attempted) as total_fga,
-                SUM(pb.free_throws_attempted) as total_fta,
-                COUNT(DISTINCT pb.game_id) as games_played
-            FROM playerboxscore pb
-            JOIN game g ON pb.game_id = g.id
-            WHERE g.season = ?
-            GROUP BY pb.player_id
-            HAVING games_played > 5
-        """
-        try:
-            season_int = int(season)
-        except (ValueError, TypeError):
-            return None
-        rows = execute_query(league, query, (season_int,))
-    else:
-        return None
-
-    if not rows:
-        return None
-
-    # Extract distributions
-    ppg_dist = [float(row.get("ppg", 0) or 0) for row in rows]
-    rpg_dist = [float(row.get("rpg", 0) or 0) for row in rows]
-    apg_dist = [float(row.get("apg", 0) or 0) for row in rows]
-
-    # Calculate TS% for each player and build distribution
-    ts_pct_dist = []
-    for row in rows:
-        total_points = row.get("total_points", 0) or 0
-        total_fga = row.get("total_fga", 0) or 0
-        total_fta = row.get("total_fta", 0) or 0
-
-        ts_denominator = 2 * (total_fga + 0.44 * total_fta)
-        if ts_denominator > 0:
-            ts_pct = total_points / ts_denominator
-            ts_pct_dist.append(float(ts_pct))
-
-    # Calculate averages
-    avg_ppg = sum(ppg_dist) / len(ppg_dist) if ppg_dist else 0
-    avg_rpg = sum(rpg_dist) / len(rpg_dist) if rpg_dist else 0
-    avg_apg = sum(apg_dist) / len(apg_dist) if apg_dist else 0
-    avg_ts_pct = sum(ts_pct_dist) / len(ts_pct_dist) if ts_pct_dist else None
-
-    return {
-        "ppg": float(avg_ppg),
-        "rpg": float(avg_rpg),
-        "apg": float(avg_apg),
-        "ts_pct": float(avg_ts_pct) if avg_ts_pct is not None else None,
-        "ppg_dist": ppg_dist,
-        "rpg_dist": rpg_dist,
-        "apg_dist": apg_dist,
-        "ts_pct_dist": ts_pct_dist if ts_pct_dist else None,
-    }
+def _int_or_none(value: Any) -> int | None:
+    """Convert a numeric total to int, treating 0/None as missing."""
+    return int(value) if value else None
 
 
 def _get_league_averages(league: str, season: str) -> dict[str, float | None] | None:
     """
     Get league averages for PPG, RPG, APG, and TS% for a given season.
 
-    DEPRECATED: Use _get_league_distributions() for new code to get percentiles.
+    DEPRECATED: Use league_service.get_league_distributions() for new code to get percentiles.
 
     Args:
         league: League name (usports, ccaa, cebl, hoopqueens)
@@ -140,15 +34,15 @@ def _get_league_averages(league: str, season: str) -> dict[str, float | None] |
     Returns:
         Dict with keys: ppg, rpg, apg, ts_pct (or None if not calculable)
     """
-    result = _get_league_distributions(league, season)
+    result = get_league_distributions(league, season)
     if not result:
         return None
 
     return {
-        "ppg": result["ppg"],
-        "rpg": result["rpg"],
-        "apg": result["apg"],
-        "ts_pct": result["ts_pct"],
+        "ppg": result.ppg,
+        "rpg": result.rpg,
+        "apg": result.apg,
+        "ts_pct": result.ts_pct,
     }
 
 
@@ -246,12 +140,10 @@ def _get_usports_ccaa_details(league: str, player_id: str) -> PlayerDetail | Non
 
     # Convert to PlayerSeasonStats with enhanced metrics
     seasons = []
-    for row in rows:
+    all_advanced_stats = calculate_advanced_stats_batch(rows, league)
+    for row, advanced_stats in zip(rows, all_advanced_stats):
         gp = row.get("games_played") or 1  # Avoid division by zero
 
-        # Calculate advanced stats
-        advanced_stats = calculate_advanced_stats(row, league)
-
         # Get team stats for context
         team_stats = get_team_stats(league, row["team"], row["season"])
 
@@ -311,8 +203,8 @@ def _get_usports_ccaa_details(league: str, player_id: str) -> PlayerDetail | Non
         # Calculate league comparison (player vs league average) - only for regular season
         league_comparison = None
         if row.get("season_type") == "regular":
-            league_data = _get_league_distributions(league, row["season"])
-            if league_data and league_data["ppg"] and league_data["rpg"] and league_data["apg"]:
+            league_data = get_league_distributions(league, row["season"])
+            if league_data and league_data.ppg and league_data.rpg and league_data.apg:
                 player_ppg = player_pg_stats["ppg"]
                 player_rpg = player_pg_stats["rpg"]
                 player_apg = player_pg_stats["apg"]
@@ -323,14 +215,7 @@ def _get_usports_ccaa_details(league: str, player_id: str) -> PlayerDetail | Non
                     player_rpg=player_rpg,
                     player_apg=player_apg,
                     player_ts_pct=player_ts_pct,
-                    league_avg_ppg=league_data["ppg"],
-                    league_avg_rpg=league_data["rpg"],
-                    league_avg_apg=league_data["apg"],
-                    league_avg_ts_pct=league_data["ts_pct"],
-                    league_ppg_distribution=league_data.get("ppg_dist"),
-                    league_rpg_distribution=league_data.get("rpg_dist"),
-                    league_apg_distribution=league_data.get("apg_dist"),
-                    league_ts_pct_distribution=league_data.get("ts_pct_dist"),
+                    league_distributions=league_data,
                 )
 
         season_stats = PlayerSeasonStats(
@@ -504,12 +389,10 @@ def _get_cebl_details(player_id: str) -> PlayerDetail | None:
 
     # Convert to PlayerSeasonStats with enhanced metrics
     seasons = []
-    for row in rows:
+    all_advanced_stats = calculate_advanced_stats_batch(rows, "cebl")
+    for row, advanced_stats in zip(rows, all_advanced_stats):
         gp = row.get("games_played") or 1
 
-        # Calculate advanced stats
-        advanced_stats = calculate_advanced_stats(row, "cebl")
-
         # Get team stats for context
         team_stats = get_team_stats("cebl", row["team"], str(row["season"]))
 
@@ -541,8 +424,8 @@ def _get_cebl_details(player_id: str) -> PlayerDetail | None:
 
         # Calculate league comparison (player vs league average)
         league_comparison = None
-        league_data = _get_league_distributions("cebl", str(row["season"]))
-        if league_data and league_data["ppg"] and league_data["rpg"] and league_data["apg"]:
+        league_data = get_league_distributions("cebl", str(row["season"]))
+        if league_data and league_data.ppg and league_data.rpg and league_data.apg:
             player_ppg = player_pg_stats["ppg"]
             player_rpg = player_pg_stats["rpg"]
             player_apg = player_pg_stats["apg"]
@@ -553,14 +436,7 @@ def _get_cebl_details(player_id: str) -> PlayerDetail | None:
                 player_rpg=player_rpg,
                 player_apg=player_apg,
                 player_ts_pct=player_ts_pct,
-                league_avg_ppg=league_data["ppg"],
-                league_avg_rpg=league_data["rpg"],
-                league_avg_apg=league_data["apg"],
-                league_avg_ts_pct=league_data["ts_pct"],
-                league_ppg_distribution=league_data.get("ppg_dist"),
-                league_rpg_distribution=league_data.get("rpg_dist"),
-                league_apg_distribution=league_data.get("apg_dist"),
-                league_ts_pct_distribution=league_data.get("ts_pct_dist"),
+                league_distributions=league_data,
             )
 
         season_stats = PlayerSeasonStats(
@@ -569,22 +445,16 @@ def _get_cebl_details(player_id: str) -> PlayerDetail | None:
             # Core counting stats
             games_played=row.get("games_played"),
             games_started=None,  # Not available in CEBL data
-            total_minutes=int(row.get("minutes", 0)) if row.get("minutes") else None,
+            total_minutes=_int_or_none(row.get("minutes")),
             minutes_per_game=round(row["minutes"] / gp, 1) if row.get("minutes") else None,
             # Scoring (totals)
-            total_points=int(float(row["points"])) if row.get("points") else None,
-            total_field_goals_made=int(float(row["field_goals_made"])) if row.get("field_goals_made") else None,
-            total_field_goals_attempted=int(float(row["field_goals_attempted"]))
-            if row.get("field_goals_attempted")
-            else None,
-            total_three_pointers_made=int(float(row["three_points_made"])) if row.get("three_points_made") else None,
-            total_three_pointers_attempted=int(float(row["three_points_attempted"]))
-            if row.get("three_points_attempted")
-            else None,
-            total_free_throws_made=int(float(row["free_throws_made"])) if row.get("free_throws_made") else None,
-            total_free_throws_attempted=int(float(row["free_throws_attempted"]))
-            if row.get("free_throws_attempted")
-            else None,
+            total_points=_int_or_none(row.get("points")),
+            total_field_goals_made=_int_or_none(row.get("field_goals_made")),
+            total_field_goals_attempted=_int_or_none(row.get("field_goals_attempted")),
+            total_three_pointers_made=_int_or_none(row.get("three_points_made")),
+            total_three_pointers_attempted=_int_or_none(row.get("three_points_attempted")),
+            total_free_throws_made=_int_or_none(row.get("free_throws_made")),
+            total_free_throws_attempted=_int_or_none(row.get("free_throws_attempted")),
             # Scoring (per game)
             points_per_game=round(row["points"] / gp, 1) if row.get("points") else None,
             field_goal_percentage=row.get("field_goal_percentage", 0) / 100
@@ -597,9 +467,9 @@ def _get_cebl_details(player_id: str) -> PlayerDetail | None:
             if row.get("free_throw_percentage") is not None
             else None,
             # Rebounds (totals)
-            total_rebounds=int(float(row["rebounds"])) if row.get("rebounds") else None,
-            total_offensive_rebounds=int(float(row["offensive_rebounds"])) if row.get("offensive_rebounds") else None,
-            total_defensive_rebounds=int(float(row["defensive_rebounds"])) if row.get("defensive_rebounds") else None,
+            total_rebounds=_int_or_none(row.get("rebounds")),
+            total_offensive_rebounds=_int_or_none(row.get("offensive_rebounds")),
+            total_defensive_rebounds=_int_or_none(row.get("defensive_rebounds")),
             # Rebounds (per game)
             rebounds_per_game=round(row["rebounds"] / gp, 1) if row.get("rebounds") else None,
             offensive_rebounds_per_game=round(row["offensive_rebounds"] / gp, 1)
@@ -609,11 +479,11 @@ def _get_cebl_details(player_id: str) -> PlayerDetail | None:
             if row.get("defensive_rebounds")
             else None,
             # Playmaking & Defense (totals)
-            total_assists=int(float(row["assists"])) if row.get("assists") else None,
-            total_steals=int(float(row["steals"])) if row.get("steals") else None,
-            total_blocks=int(float(row["blocks"])) if row.get("blocks") else None,
-            total_turnovers=int(float(row["turnovers"])) if row.get("turnovers") else None,
-            total_personal_fouls=int(float(row["fouls"])) if row.get("fouls") else None,
+            total_assists=_int_or_none(row.get("assists")),
+            total_steals=_int_or_none(row.get("steals")),
+            total_blocks=_int_or_none(row.get("blocks")),
+            total_turnovers=_int_or_none(row.get("turnovers")),
+            total_personal_fouls=_int_or_none(row.get("fouls")),
             # Playmaking & Defense (per game)
             assists_per_game=round(row["assists"] / gp, 1) if row.get("assists") else None,
             steals_per_game=round(row["steals"] / gp, 1) if row.get("steals") else None,
@@ -677,9 +547,10 @@ def _get_hoopqueens_details(player_id: str) -> PlayerDetail | None:
     current_team = player_info.get("team")
 
     # Get aggregated stats from playerboxscore for each season
+    # (season is cast to TEXT in SQL so it can be used directly as a lookup key and PlayerSeasonStats.season)
     stats_query = """
         SELECT
-            g.season,
+            CAST(g.season AS TEXT) as season,
             COUNT(DISTINCT pb.game_id) as games_played,
             SUM(pb.points) as total_points,
             SUM(pb.total_rebounds) as total_rebounds,
@@ -709,7 +580,7 @@ def _get_hoopqueens_details(player_id: str) -> PlayerDetail | None:
     # Get game-by-game logs for variance calculations (per season)
     game_logs_query = """
         SELECT
-            g.season,
+            CAST(g.season AS TEXT) as season,
             pb.points,
             pb.plus_minus,
             pb.fouls_drawn,
@@ -725,14 +596,15 @@ def _get_hoopqueens_details(player_id: str) -> PlayerDetail | None:
     # Group game logs by season for per-season calculations
     game_logs_by_season = {}
     for log in game_logs:
-        season_key = str(log["season"])
+        season_key = log["season"]
         if season_key not in game_logs_by_season:
             game_logs_by_season[season_key] = []
         game_logs_by_season[season_key].append(log)
 
     # Convert to PlayerSeasonStats with enhanced metrics
     seasons = []
-    for row in stats_rows:
+    all_advanced_stats = calculate_advanced_stats_batch(stats_rows, "hoopqueens")
+    for row, advanced_stats in zip(stats_rows, all_advanced_stats):
         gp = row.get("games_played") or 1
 
         # Calculate percentages
@@ -748,11 +620,8 @@ def _get_hoopqueens_details(player_id: str) -> PlayerDetail | None:
         if row.get("total_ft_attempted") and row["total_ft_attempted"] > 0:
             ft_pct = round(row["total_ft_made"] / row["total_ft_attempted"], 3)
 
-        # Calculate advanced stats
-        advanced_stats = calculate_advanced_stats(row, "hoopqueens")
-
         # Get team stats for context
-        team_stats = get_team_stats("hoopqueens", player_info["team"], str(row["season"]))
+        team_stats = get_team_stats("hoopqueens", player_info["team"], row["season"])
 
         # Prepare per-game stats dict for team context calculation
         player_pg_stats = {
@@ -774,16 +643,15 @@ def _get_hoopqueens_details(player_id: str) -> PlayerDetail | None:
             advanced_stats.usage_rate = usage_rate
 
         # Get game logs for this season
-        season_key = str(row["season"])
-        season_game_logs = game_logs_by_season.get(season_key, [])
+        season_game_logs = game_logs_by_season.get(row["season"], [])
 
         # Calculate league-specific stats (HoopQueens has plus/minus, variance)
         league_specific = calculate_league_specific_stats("hoopqueens", game_logs=season_game_logs)
 
         # Calculate league comparison (player vs league average)
         league_comparison = None
-        league_data = _get_league_distributions("hoopqueens", str(row["season"]))
-        if league_data and league_data["ppg"] and league_data["rpg"] and league_data["apg"]:
+        league_data = get_league_distributions("hoopqueens", row["season"])
+        if league_data and league_data.ppg and league_data.rpg and league_data.apg:
             player_ppg = player_pg_stats["total_points"]
             player_rpg = player_pg_stats["total_rebounds"]
             player_apg = player_pg_stats["total_assists"]
@@ -794,23 +662,16 @@ def _get_hoopqueens_details(player_id: str) -> PlayerDetail | None:
                 player_rpg=player_rpg,
                 player_apg=player_apg,
                 player_ts_pct=player_ts_pct,
-                league_avg_ppg=league_data["ppg"],
-                league_avg_rpg=league_data["rpg"],
-                league_avg_apg=league_data["apg"],
-                league_avg_ts_pct=league_data["ts_pct"],
-                league_ppg_distribution=league_data.get("ppg_dist"),
-                league_rpg_distribution=league_data.get("rpg_dist"),
-                league_apg_distribution=league_data.get("apg_dist"),
-                league_ts_pct_distribution=league_data.get("ts_pct_dist"),
+                league_distributions=league_data,
             )
 
         season_stats = PlayerSeasonStats(
-            season=str(row["season"]),
+            season=row["season"],
             team=player_info["team"],
             # Core counting stats
             games_played=row.get("games_played"),
             games_started=None,  # Not tracked in HoopQueens
-            total_minutes=int(row.get("total_minutes", 0)) if row.get("total_minutes") else None,
+            total_minutes=_int_or_none(row.get("total_minutes")),
             minutes_per_game=round(row["total_minutes"] / gp, 1) if row.get("total_minutes") else None,
             # Scoring (totals)
             total_points=row.get("total_points"),
@@ -998,22 +859,22 @@ def _calculate_career_stats_for_type(
         team="All Teams",
         games_played=total_gp,
         # Total stats
-        total_minutes=int(total_minutes) if total_minutes else None,
+        total_minutes=_int_or_none(total_minutes),
         total_points=int(total_points),
         total_rebounds=int(total_rebounds),
-        total_offensive_rebounds=int(total_offensive_rebounds) if total_offensive_rebounds else None,
-        total_defensive_rebounds=int(total_defensive_rebounds) if total_defensive_rebounds else None,
+        total_offensive_rebounds=_int_or_none(total_offensive_rebounds),
+        total_defensive_rebounds=_int_or_none(total_defensive_rebounds),
         total_assists=int(total_assists),
         total_steals=int(total_steals),
         total_blocks=int(total_blocks),
         total_turnovers=int(total_turnovers),
-        total_personal_fouls=int(total_fouls) if total_fouls else None,
-        total_field_goals_made=int(total_fg_made) if total_fg_made else None,
-        total_field_goals_attempted=int(total_fg_attempted) if total_fg_attempted else None,
-        total_three_pointers_made=int(total_three_made) if total_three_made else None,
-        total_three_pointers_attempted=int(total_three_attempted) if total_three_attempted else None,
-        total_free_throws_made=int(total_ft_made) if total_ft_made else None,
-        total_free_throws_attempted=int(total_ft_attempted) if total_ft_attempted else None,
+        total_personal_fouls=_int_or_none(total_fouls),
+        total_field_goals_made=_int_or_none(total_fg_made),
+        total_field_goals_attempted=_int_or_none(total_fg_attempted),
+        total_three_pointers_made=_int_or_none(total_three_made),
+        total_three_pointers_attempted=_int_or_none(total_three_attempted),
+        total_free_throws_made=_int_or_none(total_ft_made),
+        total_free_throws_attempted=_int_or_none(total_ft_attempted),
         # Per-game stats
         minutes_per_game=round(total_minutes / total_gp, 1) if total_minutes else None,
         points_per_game=round(total_points / total_gp, 1),
@@ -1082,22 +943,22 @@ def _calculate_career_stats_from_seasons(
             team="All Teams",
             games_played=total_gp,
             # Total stats
-            total_minutes=int(sum_total_minutes) if sum_total_minutes else None,
+            total_minutes=_int_or_none(sum_total_minutes),
             total_points=int(sum_total_points),
             total_rebounds=int(sum_total_rebounds),
-            total_offensive_rebounds=int(sum_total_offensive_rebounds) if sum_total_offensive_rebounds else None,
-            total_defensive_rebounds=int(sum_total_defensive_rebounds) if sum_total_defensive_rebounds else None,
+            total_offensive_rebounds=_int_or_none(sum_total_offensive_rebounds),
+            total_defensive_rebounds=_int_or_none(sum_total_defensive_rebounds),
             total_assists=int(sum_total_assists),
             total_steals=int(sum_total_steals),
             total_blocks=int(sum_total_blocks),
             total_turnovers=int(sum_total_turnovers),
-            total_personal_fouls=int(sum_total_fouls) if sum_total_fouls else None,
-            total_field_goals_made=int(sum_total_fg_made) if sum_total_fg_made else None,
-            total_field_goals_attempted=int(sum_total_fg_attempted) if sum_total_fg_attempted else None,
-            total_three_pointers_made=int(sum_total_three_made) if sum_total_three_made else None,
-            total_three_pointers_attempted=int(sum_total_three_attempted) if sum_total_three_attempted else None,
-            total_free_throws_made=int(sum_total_ft_made) if sum_total_ft_made else None,
-            total_free_throws_attempted=int(sum_total_ft_attempted) if sum_total_ft_attempted else None,
+            total_personal_fouls=_int_or_none(sum_total_fouls),
+            total_field_goals_made=_int_or_none(sum_total_fg_made),
+            total_field_goals_attempted=_int_or_none(sum_total_fg_attempted),
+            total_three_pointers_made=_int_or_none(sum_total_three_made),
+            total_three_pointers_attempted=_int_or_none(sum_total_three_attempted),
+            total_free_throws_made=_int_or_none(sum_total_ft_made),
+            total_free_throws_attempted=_int_or_none(sum_total_ft_attempted),
             # Per-game stats
             minutes_per_game=round(total_mpg / total_gp, 1) if total_mpg else None,
             points_per_game=round(total_ppg / total_gp, 1),
@@ -1154,7 +1015,8 @@ def get_shot_chart_data(player_id: int):
         for row in rows
     ]
 
-    seasons = sorted(set(row["season"] for row in rows), reverse=True)
+    # Rows are ordered by season DESC, so first-seen order is already most recent first
+    seasons = list(dict.fromkeys(row["season"] for row in rows))
 
     return ShotChartData(player_id=player_id_val, full_name=full_name, shots=shots, seasons=seasons)
 
@@ -1211,6 +1073,7 @@ def get_shot_chart_data_by_name(player_name: str):
         for row in rows
     ]
 
-    seasons = sorted(set(row["season"] for row in rows), reverse=True)
+    # Rows are ordered by season DESC, so first-seen order is already most recent first
+    seasons = list(dict.fromkeys(row["season"] for row in rows))
 
     return ShotChartData(player_id=player_id_val, full_name=full_name, shots=shots, seasons=seasons)
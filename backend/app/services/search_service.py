@@ -1,15 +1,79 @@
 """Player search service with fuzzy matching."""
 
-from datetime import datetime
-from typing import Any
-
-from rapidfuzz import fuzz
+import heapq
+import re
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, NamedTuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from config.constants import MENS_LEAGUE, WOMENS_LEAGUE, LeagueCategory
+from config.logging import get_logger
 
-from ..db.sqlite import execute_query, get_all_leagues
+from ..db.sqlite import LEAGUE_DBS, get_all_leagues, iter_query
 from ..schemas.player import PlayerSearchResult
 
+logger = get_logger(__name__)
+
+# Seconds a league roster stays cached before it is re-read from SQLite. Data refreshes drop rosters through
+# clear_roster_cache, so this only has to outlive one scheduled re-warm (cache_service.CACHE_REWARM_INTERVAL)
+ROSTER_CACHE_TTL = 24 * 60 * 60
+# Oldest rosters are evicted beyond this many (league, seasons) entries; season filters come from callers
+ROSTER_CACHE_MAX_ENTRIES = 32
+
+# partial_ratio keeps prefix/partial queries ("kad" -> "Kadre Gray") at 100; token_set_ratio and WRatio score
+# those well below the default min_score, so they are not drop-in replacements for autocomplete-style search
+SEARCH_SCORER = fuzz.partial_ratio
+
+
+class _RosterIndex(NamedTuple):
+    """A league roster with its match keys precomputed (parallel lists, one entry per row)."""
+
+    players: list[dict[str, Any]]
+    full_names: list[str]
+    names_lower: list[str]
+
+
+@dataclass(slots=True)
+class _PlayerMatch:
+    """A matched player aggregated across their roster rows in one league."""
+
+    full_name: str
+    league: str
+    player_id: Any = None  # Actual DB player_id for CEBL/HoopQueens
+    # Name components for player_id generation (usports/ccaa only)
+    firstname_initial: str | None = None
+    last_name: str | None = None
+    # Biographical data (CEBL/HoopQueens)
+    league_category: str | None = None  # For USPORTS/CCAA
+    nationality: str | None = None
+    photo_url: str | None = None
+    age: Any = None
+    # Collected per row and deduplicated only for players that make the top 'limit'
+    teams: list[str] = field(default_factory=list)
+    seasons: list[str] = field(default_factory=list)
+    positions: list[str] = field(default_factory=list)
+
+
+# Photo URLs are only passed through when they are absolute http(s) links
+_PHOTO_URL_RE = re.compile(r"https?://")
+
+# (league, sorted seasons) -> (fetched_at, roster index)
+_ROSTER_CACHE: dict[tuple[str, tuple[str, ...]], tuple[float, _RosterIndex]] = {}
+# Guards expiry/eviction/insert: rosters are built on search pool and to_thread workers concurrently
+_ROSTER_CACHE_LOCK = threading.Lock()
+
+# Shared by every search so worker threads (and their cached SQLite connections) are reused across calls
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=len(LEAGUE_DBS), thread_name_prefix="player-search")
+
 
 def search_players(
     query: str,
@@ -37,169 +101,286 @@ def search_players(
     query = query.strip().lower()
     query_parts = query.split()  # Split for multi-word matching
 
+    # Also match individual query parts (e.g., "aaron rhooms" matches both "Aaron" and "Rhooms"),
+    # skipping very short parts (single letters) to avoid false matches
+    valid_parts = [part for part in query_parts if len(part) > 1 and part != query]
+    queries = list(dict.fromkeys([query, *valid_parts]))  # Dedupe repeated parts ("smith smith")
+
     # Determine which leagues to search
     target_leagues = leagues if leagues else get_all_leagues()
 
-    # Collect results from all leagues (up to 'limit' per league)
-    all_results: list[tuple[PlayerSearchResult, int]] = []  # (result, score)
+    # Search leagues concurrently on the shared pool, up to 'limit' results per league. Pool threads score
+    # single-threaded so concurrent searches don't each start a thread per core; a single league runs inline
+    # and lets rapidfuzz use every core. map() keeps results in target_leagues order so ties sort the same
+    # way as a sequential search.
+    all_results: list[tuple[_PlayerMatch, float]] = []  # (aggregated player, score)
+    if len(target_leagues) > 1:
+        mapper, workers = _SEARCH_EXECUTOR.map, 1
+    else:
+        mapper, workers = map, -1
+    for league_results in mapper(
+        lambda league: _search_league(league, queries, seasons, limit, min_score, workers), target_leagues
+    ):
+        all_results.extend(league_results)
+
+    # Sort all results by score (descending); callers get every league's top matches, so no cap here.
+    # PlayerSearchResult models are only built once the final order is known.
+    all_results.sort(key=itemgetter(1), reverse=True)
+    return [_build_search_result(data) for data, _ in all_results]
+
+
+def _search_league(
+    league: str,
+    queries: list[str],
+    seasons: list[str] | None,
+    limit: int,
+    min_score: int,
+    workers: int = 1,
+) -> list[tuple[_PlayerMatch, float]]:
+    """
+    Fuzzy match a single league's roster and aggregate its top matches.
 
-    for league in target_leagues:
-        # Get players from this league
-        try:
-            players = _get_players_from_league(league, seasons)
-            league_scored_players: list[tuple[str, int]] = []  # (full_name, score)
-            league_player_map: dict[str, dict] = {}  # full_name -> player data
-
-            for player in players:
-                # Try fuzzy matching on full name
-                full_name = player.get("full_name", "") or ""
-                score = fuzz.partial_ratio(query, full_name.lower())
-
-                # Also try matching individual query parts (e.g., "aaron rhooms" matches both "Aaron" and "Rhooms")
-                if len(query_parts) > 1:
-                    part_scores = []
-                    for part in query_parts:
-                        # Skip very short parts (single letters) to avoid false matches
-                        if len(part) <= 1:
-                            continue
-                        part_score = fuzz.partial_ratio(part, full_name.lower())
-                        part_scores.append(part_score)
-                    # Use max score from parts (if any valid parts exist)
-                    if part_scores:
-                        score = max(score, max(part_scores))
-
-                if score >= min_score:
-                    # Aggregate player data
-                    if full_name not in league_player_map:
-                        # Calculate age from birth_date if available (HoopQueens)
-                        birth_date = player.get("birth_date")
-                        calculated_age = None
-                        if birth_date and not player.get("age"):
-                            try:
-                                birth_dt = datetime.fromisoformat(birth_date)
-                                today = datetime.now()
-                                calculated_age = (
-                                    today.year
-                                    - birth_dt.year
-                                    - ((today.month, today.day) < (birth_dt.month, birth_dt.day))
-                                )
-                            except (ValueError, TypeError):
-                                pass
-
-                        league_player_map[full_name] = {
-                            "full_name": full_name,
-                            "league": league,
-                            "teams": set(),
-                            "seasons": set(),
-                            "positions": set(),
-                            "player_id": player.get("player_id"),  # Store actual DB player_id for CEBL/HoopQueens
-                            # Store name components for player_id generation (usports/ccaa only)
-                            "firstname_initial": player.get("firstname_initial"),
-                            "last_name": player.get("last_name"),
-                            # Store biographical data (CEBL/HoopQueens)
-                            "league_category": player.get("league_category"),  # For USPORTS/CCAA
-                            "nationality": player.get("nationality"),
-                            "photo_url": player.get("photo_url"),
-                            "age": player.get("age") or calculated_age,
-                        }
-                        league_scored_players.append((full_name, score))  # type: ignore
-
-                    # Add team, season, position if available
-                    team = player.get("team_name") or player.get("team") or player.get("school")
-                    if team:
-                        league_player_map[full_name]["teams"].add(team)
-
-                    season = player.get("season")
-                    if season:
-                        league_player_map[full_name]["seasons"].add(str(season))
-
-                    position = player.get("position")
-                    if position:
-                        league_player_map[full_name]["positions"].add(position)
-
-            # Sort this league's results by score and take top 'limit'
-            league_scored_players.sort(key=lambda x: x[1], reverse=True)
-            top_league_players = league_scored_players[:limit]
-
-            # Convert to PlayerSearchResult objects and add to all_results
-            for full_name, score in top_league_players:
-                data = league_player_map[full_name]
-
-                # Generate player_id based on league
-                if league in ["usports", "ccaa"]:
-                    # Format: firstname.lastname_school1_school2_league
-                    # Remove spaces from school names (e.g., "Toronto Metropolitan" -> "TorontoMetropolitan")
-                    schools_cleaned = [school.replace(" ", "") for school in sorted(data["teams"])]
-                    schools_str = "_".join(schools_cleaned)
-                    player_id = f"{data['firstname_initial']}.{data['last_name']}_{schools_str}_{league}"
-                else:
-                    # For CEBL and HoopQueens, use existing player_id from database
-                    player_id = str(data.get("player_id") or full_name)
-
-                    # Determine league category
-                league_category: LeagueCategory | None = None
-                if league == "cebl":
-                    league_category = MENS_LEAGUE
-                elif league == "hoopqueens":
-                    league_category = WOMENS_LEAGUE
-                elif league in ["usports", "ccaa"] and data.get("league"):
-                    league_category = MENS_LEAGUE if data["league"] == "mens" else WOMENS_LEAGUE
-
-                # Validate and prepare photo_url (CEBL only)
-                photo_url_raw = data.get("photo_url")
-                photo_url = None
-                if photo_url_raw and isinstance(photo_url_raw, str) and photo_url_raw.strip():
-                    if photo_url_raw.startswith(("http://", "https://")):
-                        photo_url = photo_url_raw.strip()
-
-                # Convert age to int if available
-                age = None
-                if data.get("age"):
-                    try:
-                        age = int(data["age"])
-                    except (ValueError, TypeError):
-                        pass
-
-                result = PlayerSearchResult(
-                    player_id=player_id,
-                    full_name=data["full_name"],
-                    league_category=league_category,
-                    league=data["league"],
-                    teams=sorted(list(data["teams"])),
-                    seasons=sorted(list(data["seasons"]), reverse=True),  # Most recent first
-                    positions=sorted(list(data["positions"])),
-                    matches=[data["full_name"]],
-                    nationality=data.get("nationality"),
-                    age=age,
-                    photo_url=photo_url,
+    Args:
+        league: League name
+        queries: Lowercased full query followed by its individual parts (queries[0] is the full query)
+        seasons: Optional season filter
+        limit: Maximum number of results for this league
+        min_score: Minimum fuzzy match score (0-100)
+        workers: rapidfuzz cdist worker threads (1 inside the search pool, -1 for all cores)
+
+    Returns:
+        List of (aggregated player, score) tuples, best match first
+    """
+    league_results: list[tuple[_PlayerMatch, float]] = []
+    query = queries[0]
+
+    try:
+        players, full_names, names_lower = _get_roster_index(league, seasons)
+        league_scored_players: list[tuple[str, float]] = []  # (full_name, score)
+        league_player_map: dict[str, _PlayerMatch] = {}  # full_name -> aggregated player
+        today = date.today()
+
+        # Score every name against the full query and its parts in batch
+        # A name containing the full query always scores 100 with partial_ratio; only fuzzy match the rest
+        is_exact = np.fromiter((query in name for name in names_lower), dtype=bool, count=len(names_lower))
+        fuzzy_idx = np.flatnonzero(~is_exact)
+
+        # Candidate prefilter: when a single-term query already has 'limit' distinct exact hits, this league's
+        # results are filled at score 100 and fuzzy scoring the rest of the roster could only add ties.
+        # Every row of an exact-hit player is itself an exact hit, so their teams/seasons are still aggregated.
+        if len(queries) == 1 and fuzzy_idx.size and len({full_names[i] for i in np.flatnonzero(is_exact)}) >= limit:
+            fuzzy_idx = fuzzy_idx[:0]
+
+        best_scores = np.zeros(len(names_lower), dtype=np.float32)
+        best_scores[is_exact] = 100
+
+        if fuzzy_idx.size:
+            # score_cutoff lets rapidfuzz stop aligning a name as soon as it cannot reach min_score; those come back
+            # as 0 and are dropped by the >= min_score filter below
+            scores = process.cdist(
+                queries,
+                # Usually nothing matched exactly, so pass the cached list as is instead of rebuilding it
+                names_lower if fuzzy_idx.size == len(names_lower) else [names_lower[idx] for idx in fuzzy_idx],
+                scorer=SEARCH_SCORER,
+                processor=None,  # Names are lowercased once when the roster is cached
+                score_cutoff=min_score,
+                workers=workers,
+            )
+            # Single-word queries produce one row, so the per-column max is unnecessary
+            best_scores[fuzzy_idx] = scores[0] if len(queries) == 1 else scores.max(axis=0)
+
+        for idx in np.flatnonzero(best_scores >= min_score):
+            player = players[idx]
+            full_name = full_names[idx]
+            score = float(best_scores[idx])
+
+            # Aggregate player data on the exact full name, the same identity the detail lookup resolves
+            match = league_player_map.get(full_name)
+            if match is None:
+                # Calculate age from birth_date if available (HoopQueens)
+                birth_date = player.get("birth_date")
+                calculated_age = None
+                if birth_date and not player.get("age"):
+                    calculated_age = _age_from_birth_date(birth_date, today)
+
+                match = league_player_map[full_name] = _PlayerMatch(
+                    full_name=full_name,
+                    league=league,
+                    player_id=player.get("player_id"),
+                    firstname_initial=player.get("firstname_initial"),
+                    last_name=player.get("last_name"),
+                    league_category=player.get("league_category"),
+                    nationality=player.get("nationality"),
+                    photo_url=player.get("photo_url"),
+                    age=player.get("age") or calculated_age,
                 )
-                all_results.append((result, score))
+                league_scored_players.append((full_name, score))
 
-        except Exception as e:
-            print(f"Error searching {league}: {e}")
-            continue
+            # Add team, season, position if available
+            team = player.get("team_name") or player.get("team") or player.get("school")
+            if team:
+                match.teams.append(team)
 
-    # Sort all results by score (descending) and return
-    all_results.sort(key=lambda x: x[1], reverse=True)
-    return [result for result, _ in all_results]
+            season = player.get("season")
+            if season:
+                match.seasons.append(str(season))
 
+            position = player.get("position")
+            if position:
+                match.positions.append(position)
 
-def _get_players_from_league(league: str, seasons: list[str] | None = None) -> list[dict[str, Any]]:
+        # Take this league's top 'limit' by score without sorting every match
+        top_league_players = heapq.nlargest(limit, league_scored_players, key=itemgetter(1))
+
+        league_results = [(league_player_map[full_name], score) for full_name, score in top_league_players]
+    except Exception:
+        logger.exception("Error searching %s", league)
+
+    return league_results
+
+
+def _build_search_result(data: _PlayerMatch) -> PlayerSearchResult:
     """
-    Get all players from a specific league database.
+    Convert an aggregated player into a PlayerSearchResult.
 
     Args:
-        league: League name
-        seasons: Optional season filter
+        data: Aggregated player from _search_league
 
     Returns:
-        List of player records
+        PlayerSearchResult with generated player_id, deduplicated teams/seasons/positions and validated photo_url
     """
-    league = league.lower()
+    league = data.league
+    teams = sorted(set(data.teams))
+
+    # Generate player_id based on league
+    if league in ["usports", "ccaa"]:
+        # Format: firstname.lastname_school1_school2_league
+        # Remove spaces from school names (e.g., "Toronto Metropolitan" -> "TorontoMetropolitan")
+        schools_cleaned = [school.replace(" ", "") for school in teams]
+        schools_str = "_".join(schools_cleaned)
+        player_id = f"{data.firstname_initial}.{data.last_name}_{schools_str}_{league}"
+    else:
+        # For CEBL and HoopQueens, use existing player_id from database
+        player_id = str(data.player_id or data.full_name)
 
-    # Different leagues have different schemas
+    # Determine league category
+    league_category: LeagueCategory | None = None
     if league == "cebl":
-        query = """
+        league_category = MENS_LEAGUE
+    elif league == "hoopqueens":
+        league_category = WOMENS_LEAGUE
+    elif league in ["usports", "ccaa"] and data.league:
+        league_category = MENS_LEAGUE if data.league == "mens" else WOMENS_LEAGUE
+
+    # Validate and prepare photo_url (CEBL only)
+    photo_url_raw = data.photo_url
+    photo_url = photo_url_raw.strip() if isinstance(photo_url_raw, str) and _PHOTO_URL_RE.match(photo_url_raw) else None
+
+    # Convert age to int if available
+    age = None
+    if data.age:
+        try:
+            age = int(data.age)
+        except (ValueError, TypeError):
+            pass
+
+    return PlayerSearchResult(
+        player_id=player_id,
+        full_name=data.full_name,
+        league_category=league_category,
+        league=league,
+        teams=teams,
+        seasons=sorted(set(data.seasons), reverse=True),  # Most recent first
+        positions=sorted(set(data.positions)),
+        matches=[data.full_name],
+        nationality=data.nationality,
+        age=age,
+        photo_url=photo_url,
+    )
+
+
+def _age_from_birth_date(birth_date: str, today: date) -> int | None:
+    """
+    Calculate age in whole years from an ISO birth date ("YYYY-MM-DD..."), or None if it cannot be parsed.
+
+    Args:
+        birth_date: ISO formatted birth date string
+        today: Reference date (hoisted by the caller so it is read once per search)
+
+    Returns:
+        Age in years, or None
+    """
+    try:
+        if len(birth_date) >= 10 and birth_date[4] == "-" and birth_date[7] == "-":
+            # Fast path: slice the date parts instead of building a datetime
+            year, month, day = int(birth_date[0:4]), int(birth_date[5:7]), int(birth_date[8:10])
+        else:
+            birth_dt = datetime.fromisoformat(birth_date)
+            year, month, day = birth_dt.year, birth_dt.month, birth_dt.day
+    except (ValueError, TypeError):
+        return None
+
+    return today.year - year - ((today.month, today.day) < (month, day))
+
+
+def _get_roster_index(league: str, seasons: list[str] | None = None) -> _RosterIndex:
+    """
+    Get a league roster and its match keys, reusing the last build while it is younger than ROSTER_CACHE_TTL.
+
+    Names are lowercased once per fetch rather than on every search.
+    The returned index is shared between requests and must not be mutated.
+    """
+    key = (league.lower(), tuple(sorted(seasons or ())))
+    cached = _ROSTER_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < ROSTER_CACHE_TTL:
+        return cached[1]
+
+    # Build every column of the index in one pass over the streamed rows
+    index = _RosterIndex(players=[], full_names=[], names_lower=[])
+    for player in _iter_players_from_league(league, seasons):
+        full_name = player.get("full_name", "") or ""
+        index.players.append(player)
+        index.full_names.append(full_name)
+        index.names_lower.append(full_name.lower())
+
+    now = time.monotonic()
+    with _ROSTER_CACHE_LOCK:
+        # Drop expired rosters (any key) and, if still full, the oldest one before inserting
+        for stale_key in [k for k, (fetched_at, _) in _ROSTER_CACHE.items() if now - fetched_at >= ROSTER_CACHE_TTL]:
+            del _ROSTER_CACHE[stale_key]
+        if key not in _ROSTER_CACHE and len(_ROSTER_CACHE) >= ROSTER_CACHE_MAX_ENTRIES:
+            del _ROSTER_CACHE[next(iter(_ROSTER_CACHE))]
+
+        _ROSTER_CACHE[key] = (now, index)
+    return index
+
+
+def warm_roster_cache(leagues: list[str] | None = None) -> None:
+    """
+    Load any missing or expired league rosters ahead of a search.
+
+    Failures are logged and ignored; the search itself will retry the load.
+
+    Args:
+        leagues: Leagues to warm (default: all)
+    """
+    for league in leagues or get_all_leagues():
+        try:
+            _get_roster_index(league)
+        except Exception:
+            logger.exception("Error warming %s roster", league)
+
+
+def clear_roster_cache() -> None:
+    """Drop all cached league rosters (e.g. after an ETL refresh)."""
+    with _ROSTER_CACHE_LOCK:
+        _ROSTER_CACHE.clear()
+
+
+# Roster query per league (different leagues have different schemas) and the column seasons are filtered on
+_ROSTER_QUERIES: dict[str, tuple[str, str]] = {
+    "cebl": (
+        """
             SELECT DISTINCT
                 player_id,
                 full_name,
@@ -210,17 +391,12 @@ def _get_players_from_league(league: str, seasons: list[str] | None = None) -> l
                 photo_url,
                 age
             FROM players
+        """,
+        "season",
+    ),
+    # Column names: firstname_initial = single character (e.g., "B"), last_name = full last name (e.g., "Bakovic")
+    "usports": (
         """
-        params = ()
-
-        if seasons:
-            placeholders = ",".join("?" * len(seasons))
-            query += f" WHERE season IN ({placeholders})"
-            params = tuple(seasons)
-
-    elif league in ["usports", "ccaa"]:
-        # Column names: firstname_initial = single character (e.g., "B"), last_name = full last name (e.g., "Bakovic")
-        query = """
             SELECT DISTINCT
                 firstname_initial,
                 last_name,
@@ -229,18 +405,13 @@ def _get_players_from_league(league: str, seasons: list[str] | None = None) -> l
                 season,
                 league
             FROM player_stats
+        """,
+        "season",
+    ),
+    # HoopQueens uses player table with team JOIN
+    # Use first_name and last_name for full name matching
+    "hoopqueens": (
         """
-        params = ()
-
-        if seasons:
-            placeholders = ",".join("?" * len(seasons))
-            query += f" WHERE season IN ({placeholders})"
-            params = tuple(seasons)
-
-    elif league == "hoopqueens":
-        # HoopQueens uses player table with team JOIN
-        # Use first_name and last_name for full name matching
-        query = """
             SELECT DISTINCT
                 p.id as player_id,
                 p.first_name || ' ' || p.last_name as full_name,
@@ -251,15 +422,40 @@ def _get_players_from_league(league: str, seasons: list[str] | None = None) -> l
                 p.birth_date
             FROM player p
             LEFT JOIN team t ON p.team_id = t.id
-        """
-        params = ()
+        """,
+        "p.season",
+    ),
+}
+_ROSTER_QUERIES["ccaa"] = _ROSTER_QUERIES["usports"]
 
-        if seasons:
-            placeholders = ",".join("?" * len(seasons))
-            query += f" WHERE p.season IN ({placeholders})"
-            params = tuple(int(s) for s in seasons)
 
-    else:
-        return []
+@lru_cache(maxsize=64)
+def _roster_query(league: str, n_seasons: int) -> str:
+    """Build (once per league and season count) the roster SQL with n_seasons season placeholders."""
+    query, season_column = _ROSTER_QUERIES[league]
+    if n_seasons:
+        placeholders = ",".join("?" * n_seasons)
+        query += f" WHERE {season_column} IN ({placeholders})"
+    return query
+
+
+def _iter_players_from_league(league: str, seasons: list[str] | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Stream all players from a specific league database.
+
+    Args:
+        league: League name
+        seasons: Optional season filter
+
+    Returns:
+        Iterator over player records
+    """
+    league = league.lower()
+    if league not in _ROSTER_QUERIES:
+        return iter([])
+
+    seasons = seasons or []
+    # HoopQueens stores season as an integer
+    params = tuple(int(s) for s in seasons) if league == "hoopqueens" else tuple(seasons)
 
-    return execute_query(league, query, params)
+    return iter_query(league, _roster_query(league, len(seasons)), params)
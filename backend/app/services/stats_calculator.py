@@ -5,7 +5,8 @@ team context metrics, and league-specific statistics. All functions
 are stateless and accept raw data inputs.
 """
 
-from statistics import stdev
+from bisect import bisect_left
+from collections.abc import Sequence
 from typing import Any
 
 from ..schemas.player import (
@@ -14,6 +15,70 @@ from ..schemas.player import (
     LeagueSpecificStats,
     TeamContextStats,
 )
+from .league_service import LeagueDistributions
+from .team_service import TeamStats
+
+# Share of free throw attempts that end a possession (TS% and usage rate)
+_TS_FTA_COEF = 0.44
+# Minutes per game for one player position (40-minute games)
+_MINUTES_PER_GAME = 40
+# Ratio -> percentage
+_SHARE_SCALE = 100
+
+# Season total field names per league, in the order:
+# points, FGA, FTA, FGM, 3PM, assists, turnovers
+_ADVANCED_STATS_FIELDS: dict[str, tuple[str, ...]] = {
+    "usports": (
+        "total_points",
+        "field_goal_attempted",
+        "free_throws_attempted",
+        "field_goal_made",
+        "three_pointers_made",
+        "assists",
+        "turnovers",
+    ),
+    "cebl": (
+        "points",
+        "field_goals_attempted",
+        "free_throws_attempted",
+        "field_goals_made",
+        "three_points_made",
+        "assists",
+        "turnovers",
+    ),
+    # HoopQueens (also used for unknown leagues)
+    "hoopqueens": (
+        "total_points",
+        "total_fg_attempted",
+        "total_ft_attempted",
+        "total_fg_made",
+        "total_3p_made",
+        "total_assists",
+        "total_turnovers",
+    ),
+}
+_ADVANCED_STATS_FIELDS["ccaa"] = _ADVANCED_STATS_FIELDS["usports"]
+
+# Per-game field names per league for team context, in the order:
+# PPG, RPG, APG, SPG, BPG, MPG, FGA, FTA, TOV
+_TEAM_CONTEXT_FIELDS: dict[str, tuple[str, ...]] = {
+    "usports": ("ppg", "rpg", "apg", "spg", "bpg", "mpg", "field_goal_attempted", "free_throws_attempted", "turnovers"),
+    # CEBL passes per-game values already calculated
+    "cebl": ("ppg", "rpg", "apg", "spg", "bpg", "mpg", "fga_pg", "fta_pg", "tov_pg"),
+    # HoopQueens passes per-game values under its season total names (also used for unknown leagues)
+    "hoopqueens": (
+        "total_points",
+        "total_rebounds",
+        "total_assists",
+        "total_steals",
+        "total_blocks",
+        "total_minutes",
+        "total_fg_attempted",
+        "total_ft_attempted",
+        "total_turnovers",
+    ),
+}
+_TEAM_CONTEXT_FIELDS["ccaa"] = _TEAM_CONTEXT_FIELDS["usports"]
 
 
 def calculate_advanced_stats(player_stats: dict[str, Any], league: str) -> AdvancedStats:
@@ -27,63 +92,59 @@ def calculate_advanced_stats(player_stats: dict[str, Any], league: str) -> Advan
     Returns:
         AdvancedStats object with calculated metrics
     """
-    # Extract stats based on league-specific field names
-    if league in ["usports", "ccaa"]:
-        points = player_stats.get("total_points", 0)
-        fga = player_stats.get("field_goal_attempted", 0)
-        fta = player_stats.get("free_throws_attempted", 0)
-        fgm = player_stats.get("field_goal_made", 0)
-        three_pm = player_stats.get("three_pointers_made", 0)
-        assists = player_stats.get("assists", 0)
-        turnovers = player_stats.get("turnovers", 0)
-    elif league == "cebl":
-        points = player_stats.get("points", 0) or 0
-        fga = player_stats.get("field_goals_attempted", 0) or 0
-        fta = player_stats.get("free_throws_attempted", 0) or 0
-        fgm = player_stats.get("field_goals_made", 0) or 0
-        three_pm = player_stats.get("three_points_made", 0) or 0
-        assists = player_stats.get("assists", 0) or 0
-        turnovers = player_stats.get("turnovers", 0) or 0
-    else:
-        # HoopQueens or unknown
-        points = player_stats.get("total_points", 0) or 0
-        fga = player_stats.get("total_fg_attempted", 0) or 0
-        fta = player_stats.get("total_ft_attempted", 0) or 0
-        fgm = player_stats.get("total_fg_made", 0) or 0
-        three_pm = player_stats.get("total_3p_made", 0) or 0
-        assists = player_stats.get("total_assists", 0) or 0
-        turnovers = player_stats.get("total_turnovers", 0) or 0
-
-    # True Shooting Percentage: Points / (2 * (FGA + 0.44 * FTA))
-    ts_pct = None
-    ts_denominator = 2 * (fga + 0.44 * fta)
-    if ts_denominator > 0:
-        ts_pct = round(points / ts_denominator, 3)
-
-    # Effective Field Goal Percentage: (FGM + 0.5 * 3PM) / FGA
-    efg_pct = None
-    if fga > 0:
-        efg_pct = round((fgm + 0.5 * three_pm) / fga, 3)
-
-    # Assist-to-Turnover Ratio
-    ast_to_ratio = None
-    if turnovers > 0:
-        ast_to_ratio = round(assists / turnovers, 2)
-
-    # Usage Rate (simplified): (FGA + 0.44 * FTA + TO) - would need team stats for proper calculation
-    # We'll calculate this in team context instead
-    usage_rate = None
+    return calculate_advanced_stats_batch([player_stats], league)[0]
 
-    return AdvancedStats(
-        true_shooting_pct=ts_pct,
-        effective_fg_pct=efg_pct,
-        assist_to_turnover_ratio=ast_to_ratio,
-        usage_rate=usage_rate,  # Calculated in team context
-    )
+
+def calculate_advanced_stats_batch(rows: list[dict[str, Any]], league: str) -> list[AdvancedStats]:
+    """
+    Calculate advanced statistical metrics for several season rows from the same league.
+
+    League-specific field names are resolved once for the whole batch instead of per row.
+
+    Args:
+        rows: Raw player statistics, one dict per season
+        league: League name (affects field names)
+
+    Returns:
+        AdvancedStats objects in the same order as rows
+    """
+    fields = _ADVANCED_STATS_FIELDS.get(league, _ADVANCED_STATS_FIELDS["hoopqueens"])
+
+    results = []
+    for row in rows:
+        points, fga, fta, fgm, three_pm, assists, turnovers = (row.get(field) or 0 for field in fields)
+
+        # True Shooting Percentage: Points / (2 * (FGA + 0.44 * FTA))
+        ts_pct = None
+        ts_denominator = 2 * (fga + _TS_FTA_COEF * fta)
+        if ts_denominator > 0:
+            ts_pct = round(points / ts_denominator, 3)
+
+        # Effective Field Goal Percentage: (FGM + 0.5 * 3PM) / FGA
+        efg_pct = None
+        if fga > 0:
+            efg_pct = round((fgm + 0.5 * three_pm) / fga, 3)
+
+        # Assist-to-Turnover Ratio
+        ast_to_ratio = None
+        if turnovers > 0:
+            ast_to_ratio = round(assists / turnovers, 2)
+
+        # Usage Rate needs team stats, so it is calculated in team context instead
+        results.append(
+            AdvancedStats(
+                true_shooting_pct=ts_pct,
+                effective_fg_pct=efg_pct,
+                assist_to_turnover_ratio=ast_to_ratio,
+                usage_rate=None,  # Calculated in team context
+            )
+        )
+
+    return results
 
 
 def calculate_team_context_stats(
-    player_stats: dict[str, Any], team_stats: dict[str, Any] | None, league: str
+    player_stats: dict[str, Any], team_stats: TeamStats | None, league: str
 ) -> tuple[TeamContextStats | None, float | None]:
     """
     Calculate player's statistical contribution relative to team.
@@ -101,76 +162,50 @@ def calculate_team_context_stats(
 
     # Extract player stats based on league
     # All leagues now pass per-game stats in the dict
-    if league in ["usports", "ccaa"]:
-        player_ppg = player_stats.get("ppg", 0) or 0
-        player_rpg = player_stats.get("rpg", 0) or 0
-        player_apg = player_stats.get("apg", 0) or 0
-        player_spg = player_stats.get("spg", 0) or 0
-        player_bpg = player_stats.get("bpg", 0) or 0
-        player_mpg = player_stats.get("mpg", 0) or 0
-        player_fga = player_stats.get("field_goal_attempted", 0) or 0
-        player_fta = player_stats.get("free_throws_attempted", 0) or 0
-        player_tov = player_stats.get("turnovers", 0) or 0
-        # games_played = player_stats.get("games_played", 1) or 1
-    elif league == "cebl":
-        # CEBL passes per-game values already calculated
-        player_ppg = player_stats.get("ppg", 0) or 0
-        player_rpg = player_stats.get("rpg", 0) or 0
-        player_apg = player_stats.get("apg", 0) or 0
-        player_spg = player_stats.get("spg", 0) or 0
-        player_bpg = player_stats.get("bpg", 0) or 0
-        player_mpg = player_stats.get("mpg", 0) or 0
-        player_fga = player_stats.get("fga_pg", 0) or 0
-        player_fta = player_stats.get("fta_pg", 0) or 0
-        player_tov = player_stats.get("tov_pg", 0) or 0
-        # games_played = player_stats.get("games_played", 1) or 1
-    else:
-        # HoopQueens passes per-game values
-        player_ppg = player_stats.get("total_points", 0) or 0
-        player_rpg = player_stats.get("total_rebounds", 0) or 0
-        player_apg = player_stats.get("total_assists", 0) or 0
-        player_spg = player_stats.get("total_steals", 0) or 0
-        player_bpg = player_stats.get("total_blocks", 0) or 0
-        player_mpg = player_stats.get("total_minutes", 0) or 0
-        player_fga = player_stats.get("total_fg_attempted", 0) or 0
-        player_fta = player_stats.get("total_ft_attempted", 0) or 0
-        player_tov = player_stats.get("total_turnovers", 0) or 0
-        # games_played = player_stats.get("games_played", 1) or 1
-
-    # Extract team stats (per game)
-    team_ppg = team_stats.get("points_per_game", 0) or team_stats.get("ppg", 0) or 0
-    team_rpg = team_stats.get("rebounds_per_game", 0) or team_stats.get("rpg", 0) or 0
-    team_apg = team_stats.get("assists_per_game", 0) or team_stats.get("apg", 0) or 0
-    team_spg = team_stats.get("steals_per_game", 0) or team_stats.get("spg", 0) or 0
-    team_bpg = team_stats.get("blocks_per_game", 0) or team_stats.get("bpg", 0) or 0
-    team_fga = team_stats.get("field_goals_attempted_per_game", 0) or team_stats.get("fga_per_game", 0) or 0
+    fields = _TEAM_CONTEXT_FIELDS.get(league, _TEAM_CONTEXT_FIELDS["hoopqueens"])
+    (
+        player_ppg,
+        player_rpg,
+        player_apg,
+        player_spg,
+        player_bpg,
+        player_mpg,
+        player_fga,
+        player_fta,
+        player_tov,
+    ) = (player_stats.get(field, 0) or 0 for field in fields)
+
+    # Extract team stats (per game), mapping missing values to 0
+    team_ppg = team_stats.ppg or 0
+    team_rpg = team_stats.rpg or 0
+    team_apg = team_stats.apg or 0
+    team_spg = team_stats.spg or 0
+    team_bpg = team_stats.bpg or 0
+    team_fga = team_stats.fga_per_game or 0
+    team_fta = team_stats.fta_per_game or 0
+    team_tov = team_stats.tov_per_game or 0
 
     # Calculate percentage shares
-    points_share = round((player_ppg / team_ppg) * 100, 1) if team_ppg > 0 else None
-    rebounds_share = round((player_rpg / team_rpg) * 100, 1) if team_rpg > 0 else None
-    assists_share = round((player_apg / team_apg) * 100, 1) if team_apg > 0 else None
-    steals_share = round((player_spg / team_spg) * 100, 1) if team_spg > 0 else None
-    blocks_share = round((player_bpg / team_bpg) * 100, 1) if team_bpg > 0 else None
+    points_share = round((player_ppg / team_ppg) * _SHARE_SCALE, 1) if team_ppg > 0 else None
+    rebounds_share = round((player_rpg / team_rpg) * _SHARE_SCALE, 1) if team_rpg > 0 else None
+    assists_share = round((player_apg / team_apg) * _SHARE_SCALE, 1) if team_apg > 0 else None
+    steals_share = round((player_spg / team_spg) * _SHARE_SCALE, 1) if team_spg > 0 else None
+    blocks_share = round((player_bpg / team_bpg) * _SHARE_SCALE, 1) if team_bpg > 0 else None
 
     # Minutes share: player minutes / (total game minutes / 5 players) * 100
-    # Assuming 40-minute games (adjust if needed)
-    available_minutes_per_game = 40  # minutes per game for one player position
-    minutes_share = round((player_mpg / available_minutes_per_game) * 100, 1) if player_mpg > 0 else None
+    minutes_share = round((player_mpg / _MINUTES_PER_GAME) * _SHARE_SCALE, 1) if player_mpg > 0 else None
 
     # Shooting volume share
-    shooting_volume_share = round((player_fga / team_fga) * 100, 1) if team_fga > 0 else None
+    shooting_volume_share = round((player_fga / team_fga) * _SHARE_SCALE, 1) if team_fga > 0 else None
 
     # Calculate usage rate (requires team stats)
     usage_rate = None
     if team_fga > 0:
-        team_fta = team_stats.get("free_throws_attempted_per_game", 0) or team_stats.get("fta_per_game", 0) or 0
-        team_tov = team_stats.get("turnovers_per_game", 0) or team_stats.get("tov_per_game", 0) or 0
-
-        player_possessions = player_fga + 0.44 * player_fta + player_tov
-        team_possessions = team_fga + 0.44 * team_fta + team_tov
+        player_possessions = player_fga + _TS_FTA_COEF * player_fta + player_tov
+        team_possessions = team_fga + _TS_FTA_COEF * team_fta + team_tov
 
         if team_possessions > 0:
-            usage_rate = round((player_possessions / team_possessions) * 100, 1)
+            usage_rate = round((player_possessions / team_possessions) * _SHARE_SCALE, 1)
 
     return TeamContextStats(
         points_share=points_share,
@@ -223,23 +258,28 @@ def calculate_league_specific_stats(
 
         # Process game-level aggregates (from player_boxscores table)
         if game_aggregates:
+            # Read each aggregate once
+            avg_plus_minus = game_aggregates.get("avg_plus_minus")
+            total_fouls_drawn = game_aggregates.get("total_fouls_drawn")
+            total_second_chance_points = game_aggregates.get("total_second_chance_points")
+            total_fast_break_points = game_aggregates.get("total_fast_break_points")
+            total_points_in_paint = game_aggregates.get("total_points_in_paint")
+
             # Plus/minus average
-            if game_aggregates.get("avg_plus_minus") is not None:
-                league_stats.plus_minus_avg = round(game_aggregates["avg_plus_minus"], 1)
+            if avg_plus_minus is not None:
+                league_stats.plus_minus_avg = round(avg_plus_minus, 1)
 
             # Fouls drawn per game
-            if game_aggregates.get("total_fouls_drawn"):
-                league_stats.fouls_drawn_per_game = round(game_aggregates["total_fouls_drawn"] / games_played, 1)
+            if total_fouls_drawn:
+                league_stats.fouls_drawn_per_game = round(total_fouls_drawn / games_played, 1)
 
             # Situational scoring (per game)
-            if game_aggregates.get("total_second_chance_points"):
-                league_stats.second_chance_points = round(
-                    game_aggregates["total_second_chance_points"] / games_played, 1
-                )
-            if game_aggregates.get("total_fast_break_points"):
-                league_stats.fast_break_points = round(game_aggregates["total_fast_break_points"] / games_played, 1)
-            if game_aggregates.get("total_points_in_paint"):
-                league_stats.points_in_paint = round(game_aggregates["total_points_in_paint"] / games_played, 1)
+            if total_second_chance_points:
+                league_stats.second_chance_points = round(total_second_chance_points / games_played, 1)
+            if total_fast_break_points:
+                league_stats.fast_break_points = round(total_fast_break_points / games_played, 1)
+            if total_points_in_paint:
+                league_stats.points_in_paint = round(total_points_in_paint / games_played, 1)
 
             # 2-point shooting stats
             total_2pt_made = game_aggregates.get("total_2pt_made", 0) or 0
@@ -259,30 +299,43 @@ def calculate_league_specific_stats(
         games_played = len(game_logs)
 
         if games_played > 0:
-            # Plus/minus stats
-            plus_minus_values = [game.get("plus_minus", 0) or 0 for game in game_logs]
-            total_plus_minus = sum(plus_minus_values)
+            # Single pass over the game logs for every HoopQueens reduction
+            total_plus_minus = 0
+            plus_minus_min = plus_minus_max = None
+            total_fouls_drawn = 0
+            total_fga = 0
+            # Welford's online mean/M2 for points, so variance needs no second pass
+            mean_ppg = 0.0
+            m2_ppg = 0.0
+            for count, game in enumerate(game_logs, start=1):
+                plus_minus = game.get("plus_minus", 0) or 0
+                total_plus_minus += plus_minus
+                if plus_minus_min is None or plus_minus < plus_minus_min:
+                    plus_minus_min = plus_minus
+                if plus_minus_max is None or plus_minus > plus_minus_max:
+                    plus_minus_max = plus_minus
+                total_fouls_drawn += game.get("fouls_drawn", 0) or 0
+                total_fga += game.get("field_goals_attempted", 0) or 0
+                points = game.get("points", 0) or 0
+                delta = points - mean_ppg
+                mean_ppg += delta / count
+                m2_ppg += delta * (points - mean_ppg)
+
+            # Plus/minus stats and range (min/max)
             league_stats.plus_minus = round(total_plus_minus / games_played, 1)
-
-            # Plus/minus range (min/max)
-            if plus_minus_values:
-                league_stats.plus_minus_min = min(plus_minus_values)
-                league_stats.plus_minus_max = max(plus_minus_values)
+            league_stats.plus_minus_min = plus_minus_min
+            league_stats.plus_minus_max = plus_minus_max
 
             # Fouls drawn per game
-            total_fouls_drawn = sum(game.get("fouls_drawn", 0) or 0 for game in game_logs)
             league_stats.fouls_drawn_per_game = round(total_fouls_drawn / games_played, 1)
 
             # Foul drawing efficiency (fouls drawn per FGA)
-            total_fga = sum(game.get("field_goals_attempted", 0) or 0 for game in game_logs)
             if total_fga > 0:
                 league_stats.foul_drawing_efficiency = round(total_fouls_drawn / total_fga, 3)
 
             # PPG variance and consistency score
-            ppg_values = [game.get("points", 0) or 0 for game in game_logs]
-            if len(ppg_values) > 1:
-                mean_ppg = sum(ppg_values) / len(ppg_values)
-                std_ppg = stdev(ppg_values)
+            if games_played > 1:
+                std_ppg = (m2_ppg / (games_played - 1)) ** 0.5  # Sample standard deviation
                 league_stats.ppg_variance = round(std_ppg, 1)
 
                 # Consistency score (Coefficient of Variation)
@@ -311,22 +364,21 @@ def calculate_league_specific_stats(
     return league_stats
 
 
-def _calculate_percentile(value: float, distribution: list[float]) -> int | None:
+def _calculate_percentile(value: float, distribution: Sequence[float]) -> int:
     """
     Calculate percentile rank of a value within a distribution.
 
+    Callers gate on an empty/missing distribution, so this assumes at least one value.
+
     Args:
         value: The value to rank
-        distribution: List of all values in the distribution
+        distribution: All values in the distribution, sorted ascending (non-empty)
 
     Returns:
-        Percentile rank (0-100) or None if distribution is empty
+        Percentile rank (0-100)
     """
-    if not distribution:
-        return None
-
-    # Count how many values are strictly less than the player's value
-    count_below = sum(1 for v in distribution if v < value)
+    # Count how many values are strictly less than the player's value (binary search on the sorted distribution)
+    count_below = bisect_left(distribution, value)
 
     # Percentile = (count below / total) * 100
     percentile = (count_below / len(distribution)) * 100
@@ -339,14 +391,7 @@ def calculate_league_comparison(
     player_rpg: float,
     player_apg: float,
     player_ts_pct: float | None,
-    league_avg_ppg: float,
-    league_avg_rpg: float,
-    league_avg_apg: float,
-    league_avg_ts_pct: float | None,
-    league_ppg_distribution: list[float] | None = None,
-    league_rpg_distribution: list[float] | None = None,
-    league_apg_distribution: list[float] | None = None,
-    league_ts_pct_distribution: list[float] | None = None,
+    league_distributions: LeagueDistributions,
 ) -> LeagueComparison:
     """
     Calculate player's performance relative to league average for scouting context.
@@ -356,18 +401,20 @@ def calculate_league_comparison(
         player_rpg: Player rebounds per game
         player_apg: Player assists per game
         player_ts_pct: Player true shooting percentage (0-1 scale)
-        league_avg_ppg: League average points per game
-        league_avg_rpg: League average rebounds per game
-        league_avg_apg: League average assists per game
-        league_avg_ts_pct: League average true shooting percentage (0-1 scale)
-        league_ppg_distribution: List of all PPG values in league (for percentile)
-        league_rpg_distribution: List of all RPG values in league (for percentile)
-        league_apg_distribution: List of all APG values in league (for percentile)
-        league_ts_pct_distribution: List of all TS% values in league (for percentile)
+        league_distributions: League averages and sorted distributions for the season (cached per league/season)
 
     Returns:
         LeagueComparison object with relative performance metrics
     """
+    league_avg_ppg = league_distributions.ppg
+    league_avg_rpg = league_distributions.rpg
+    league_avg_apg = league_distributions.apg
+    league_avg_ts_pct = league_distributions.ts_pct
+    league_ppg_distribution = league_distributions.ppg_dist
+    league_rpg_distribution = league_distributions.rpg_dist
+    league_apg_distribution = league_distributions.apg_dist
+    league_ts_pct_distribution = league_distributions.ts_pct_dist
+
     # Calculate absolute differences
     ppg_vs_avg = round(player_ppg - league_avg_ppg, 1) if league_avg_ppg > 0 else None
     rpg_vs_avg = round(player_rpg - league_avg_rpg, 1) if league_avg_rpg > 0 else None
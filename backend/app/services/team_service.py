@@ -4,12 +4,28 @@ This module provides functions to query team statistics from
 league databases, used for calculating player team context metrics.
 """
 
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
 
 from ..db.sqlite import execute_query
 
 
-def get_team_stats(league: str, team: str, season: str) -> dict[str, Any] | None:
+@dataclass(frozen=True, slots=True)
+class TeamStats:
+    """Team per-game averages for one season (None when the total is missing or zero)."""
+
+    ppg: float | None = None
+    fga_per_game: float | None = None
+    fta_per_game: float | None = None
+    rpg: float | None = None
+    apg: float | None = None
+    tov_per_game: float | None = None
+    spg: float | None = None
+    bpg: float | None = None
+
+
+@lru_cache(maxsize=2048)
+def get_team_stats(league: str, team: str, season: str) -> TeamStats | None:
     """
     Get team statistics for a specific season.
 
@@ -19,7 +35,8 @@ def get_team_stats(league: str, team: str, season: str) -> dict[str, Any] | None
         season: Season identifier
 
     Returns:
-        Dictionary with team per-game stats or None if not found
+        TeamStats with per-game averages or None if not found.
+        Results are cached per (league, team, season); TeamStats is frozen so the shared instance is safe to hand out.
     """
     league = league.lower()
 
@@ -33,14 +50,14 @@ def get_team_stats(league: str, team: str, season: str) -> dict[str, Any] | None
     return None
 
 
-def _get_usports_ccaa_team_stats(league: str, team: str, season: str) -> dict[str, Any] | None:
+def _get_usports_ccaa_team_stats(league: str, team: str, season: str) -> TeamStats | None:
     """Get U SPORTS/CCAA team statistics."""
+    # FGA/FTA are season totals; divide in SQL (NULLIF turns a zero total into None)
     query = """
         SELECT
             points_per_game as ppg,
-            field_goal_attempted,
-            free_throws_attempted,
-            games_played,
+            NULLIF(field_goal_attempted, 0) * 1.0 / COALESCE(NULLIF(games_played, 0), 1) as fga_per_game,
+            NULLIF(free_throws_attempted, 0) * 1.0 / COALESCE(NULLIF(games_played, 0), 1) as fta_per_game,
             total_rebounds_per_game as rpg,
             assists_per_game as apg,
             turnovers_per_game as tov_per_game,
@@ -57,38 +74,28 @@ def _get_usports_ccaa_team_stats(league: str, team: str, season: str) -> dict[st
         return None
 
     row = rows[0]
-    games_played = row.get("games_played", 1) or 1
-
-    # Calculate per-game stats
-    return {
-        "ppg": row.get("ppg"),
-        "fga_per_game": round(row.get("field_goal_attempted", 0) / games_played, 1)
-        if row.get("field_goal_attempted")
-        else None,
-        "fta_per_game": round(row.get("free_throws_attempted", 0) / games_played, 1)
-        if row.get("free_throws_attempted")
-        else None,
-        "rpg": row.get("rpg"),
-        "apg": row.get("apg"),
-        "tov_per_game": row.get("tov_per_game"),
-        "spg": row.get("spg"),
-        "bpg": row.get("bpg"),
-    }
-
-
-def _get_cebl_team_stats(team: str, season: str) -> dict[str, Any] | None:
+    return TeamStats(
+        **{
+            **row,
+            "fga_per_game": round(row["fga_per_game"], 1) if row["fga_per_game"] is not None else None,
+            "fta_per_game": round(row["fta_per_game"], 1) if row["fta_per_game"] is not None else None,
+        }
+    )
+
+
+def _get_cebl_team_stats(team: str, season: str) -> TeamStats | None:
     """Get CEBL team statistics."""
+    # Totals are stored as TEXT; cast and divide by games played in SQL (NULLIF turns a zero total into None)
     query = """
         SELECT
-            games_played,
-            CAST(points_for AS REAL) as total_points,
-            CAST(field_goals_attempted AS REAL) as total_fga,
-            CAST(free_throws_attempted AS REAL) as total_fta,
-            CAST(rebounds AS REAL) as total_rebounds,
-            CAST(assists AS REAL) as total_assists,
-            CAST(turn_overs AS REAL) as total_turnovers,
-            CAST(steals AS REAL) as total_steals,
-            CAST(blocks AS REAL) as total_blocks
+            NULLIF(CAST(points_for AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as ppg,
+            NULLIF(CAST(field_goals_attempted AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as fga_per_game,
+            NULLIF(CAST(free_throws_attempted AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as fta_per_game,
+            NULLIF(CAST(rebounds AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as rpg,
+            NULLIF(CAST(assists AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as apg,
+            NULLIF(CAST(turn_overs AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as tov_per_game,
+            NULLIF(CAST(steals AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as spg,
+            NULLIF(CAST(blocks AS REAL), 0) / COALESCE(NULLIF(games_played, 0), 1) as bpg
         FROM teams
         WHERE name_en = ? AND season = ?
         LIMIT 1
@@ -99,48 +106,13 @@ def _get_cebl_team_stats(team: str, season: str) -> dict[str, Any] | None:
     if not rows:
         return None
 
-    row = rows[0]
-    games_played = row.get("games_played", 1) or 1
-
-    # Extract values and convert to float (SQLite CAST may return strings)
-    total_points = float(row.get("total_points") or 0)
-    total_fga = float(row.get("total_fga") or 0)
-    total_fta = float(row.get("total_fta") or 0)
-    total_rebounds = float(row.get("total_rebounds") or 0)
-    total_assists = float(row.get("total_assists") or 0)
-    total_turnovers = float(row.get("total_turnovers") or 0)
-    total_steals = float(row.get("total_steals") or 0)
-    total_blocks = float(row.get("total_blocks") or 0)
-
-    # Calculate per-game stats
-    return {
-        "ppg": round(total_points / games_played, 1) if total_points else None,
-        "fga_per_game": round(total_fga / games_played, 1) if total_fga else None,
-        "fta_per_game": round(total_fta / games_played, 1) if total_fta else None,
-        "rpg": round(total_rebounds / games_played, 1) if total_rebounds else None,
-        "apg": round(total_assists / games_played, 1) if total_assists else None,
-        "tov_per_game": round(total_turnovers / games_played, 1) if total_turnovers else None,
-        "spg": round(total_steals / games_played, 1) if total_steals else None,
-        "bpg": round(total_blocks / games_played, 1) if total_blocks else None,
-    }
-
-
-def _get_hoopqueens_team_stats(team: str, season: str) -> dict[str, Any] | None:
-    """Get HoopQueens team statistics by aggregating game box scores."""
-    # First get team_id from team name
-    team_query = """
-        SELECT id FROM team WHERE name = ?
-        LIMIT 1
-    """
-
-    team_rows = execute_query("hoopqueens", team_query, (team,))
+    # Round per-game averages; NULL (missing or zero total) stays None
+    return TeamStats(**{key: round(value, 1) if value is not None else None for key, value in rows[0].items()})
 
-    if not team_rows:
-        return None
-
-    team_id = team_rows[0]["id"]
 
-    # Aggregate team box scores for the season
+def _get_hoopqueens_team_stats(team: str, season: str) -> TeamStats | None:
+    """Get HoopQueens team statistics by aggregating game box scores."""
+    # Aggregate team box scores for the season, resolving the team id from its name in the same query
     stats_query = """
         SELECT
             COUNT(DISTINCT tb.game_id) as games_played,
@@ -154,23 +126,23 @@ def _get_hoopqueens_team_stats(team: str, season: str) -> dict[str, Any] | None:
             AVG(tb.blocks) as bpg
         FROM teamboxscore tb
         JOIN game g ON tb.game_id = g.id
-        WHERE tb.team_id = ? AND g.season = ?
+        WHERE tb.team_id = (SELECT id FROM team WHERE name = ? LIMIT 1) AND g.season = ?
     """
 
-    stats_rows = execute_query("hoopqueens", stats_query, (team_id, int(season)))
+    stats_rows = execute_query("hoopqueens", stats_query, (team, int(season)))
 
     if not stats_rows or stats_rows[0]["games_played"] == 0:
         return None
 
     # Round averages
     stats = stats_rows[0]
-    return {
-        "ppg": round(stats["ppg"], 1) if stats.get("ppg") else None,
-        "fga_per_game": round(stats["fga_per_game"], 1) if stats.get("fga_per_game") else None,
-        "fta_per_game": round(stats["fta_per_game"], 1) if stats.get("fta_per_game") else None,
-        "rpg": round(stats["rpg"], 1) if stats.get("rpg") else None,
-        "apg": round(stats["apg"], 1) if stats.get("apg") else None,
-        "tov_per_game": round(stats["tov_per_game"], 1) if stats.get("tov_per_game") else None,
-        "spg": round(stats["spg"], 1) if stats.get("spg") else None,
-        "bpg": round(stats["bpg"], 1) if stats.get("bpg") else None,
-    }
+    return TeamStats(
+        ppg=round(stats["ppg"], 1) if stats.get("ppg") else None,
+        fga_per_game=round(stats["fga_per_game"], 1) if stats.get("fga_per_game") else None,
+        fta_per_game=round(stats["fta_per_game"], 1) if stats.get("fta_per_game") else None,
+        rpg=round(stats["rpg"], 1) if stats.get("rpg") else None,
+        apg=round(stats["apg"], 1) if stats.get("apg") else None,
+        tov_per_game=round(stats["tov_per_game"], 1) if stats.get("tov_per_game") else None,
+        spg=round(stats["spg"], 1) if stats.get("spg") else None,
+        bpg=round(stats["bpg"], 1) if stats.get("bpg") else None,
+    )
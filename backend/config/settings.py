@@ -1,5 +1,6 @@
 """Application settings."""
 
+from functools import cached_property
 from typing import Optional
 
 from pydantic import Field
@@ -7,7 +8,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True)
 
     # Environment
     environment: str = Field(default="development", alias="ENVIRONMENT")
@@ -45,14 +46,16 @@ class Settings(BaseSettings):
     # Authentication
     agent_password: str = Field(default="demo2025", alias="AGENT_PASSWORD")
 
-    def get_postgres_conn_string(self) -> str:
+    @cached_property
+    def postgres_conn_string(self) -> str:
+        """Postgres connection string, resolved once (settings are immutable after startup)."""
         if self.node_env == "local":
             return "postgresql://localhost:5432/canada_basketball"
 
         if self.database_url:
             return self.database_url
 
-        if not all([self.rds_user, self.rds_password, self.rds_host, self.rds_db]):
+        if not (self.rds_user and self.rds_password and self.rds_host and self.rds_db):
             raise ValueError("Database credentials not configured")
 
         return f"postgresql://{self.rds_user}:{self.rds_password}@{self.rds_host}:{self.rds_port}/{self.rds_db}"
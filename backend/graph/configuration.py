@@ -1,22 +1,57 @@
 """LLM configuration."""
 
-from langchain_cohere import ChatCohere
+from functools import lru_cache
+from typing import Any
+
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from config.settings import settings
 
+# Provider by model family (the model name up to the first "-")
+_MODEL_PREFIX_PROVIDERS = {
+    "gemini": "google",
+    "command": "cohere",
+    "c4ai": "cohere",
+    "aya": "cohere",
+}
+
 
 def get_llm(model: str | None = None, temperature: float = 0.0, **kwargs) -> BaseChatModel:
-    """Get LLM instance with flexible multi-provider configuration."""
+    """
+    Get LLM instance with flexible multi-provider configuration.
+
+    Instances are cached per (model, temperature, kwargs) so the provider client and its
+    connection pool are reused across graph invocations instead of rebuilt on every call.
+    """
     # Use provided model or fallback to default
     model_name = model or settings.default_model
+
+    try:
+        return _build_llm(model_name, temperature, tuple(sorted(kwargs.items())))
+    except TypeError:
+        # Unhashable kwargs (e.g. dict values) can't be cached
+        return _create_llm(model_name, temperature, **kwargs)
+
+
+@lru_cache(maxsize=32)
+def _build_llm(model_name: str, temperature: float, kwargs_key: tuple[tuple[str, Any], ...]) -> BaseChatModel:
+    """Cached LLM construction keyed by model, temperature and sorted kwargs."""
+    return _create_llm(model_name, temperature, **dict(kwargs_key))
+
+
+def _create_llm(model_name: str, temperature: float, **kwargs) -> BaseChatModel:
+    """Construct a new LLM client for the provider matching the model name."""
     provider = _detect_provider_from_model(model_name)
 
-    # Provider-specific initialization
+    # Provider-specific initialization; provider SDKs are imported on first use so only the
+    # configured provider is loaded
     if provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         return ChatGoogleGenerativeAI(model=model_name, temperature=temperature, **kwargs)
     elif provider == "cohere":
+        from langchain_cohere import ChatCohere
+
         return ChatCohere(model=model_name, temperature=temperature, **kwargs)
     else:
         raise ValueError(f"Unsupported LLM provider: {provider}. Use 'google' or 'cohere'.")
@@ -24,14 +59,11 @@ def get_llm(model: str | None = None, temperature: float = 0.0, **kwargs) -> Bas
 
 def _detect_provider_from_model(model: str) -> str:
     """Auto-detect provider from model name."""
-    model_lower = model.lower()
-
-    if model_lower.startswith("gemini"):
-        return "google"
-    if model_lower.startswith(("command", "c4ai", "aya")):
-        return "cohere"
+    provider = _MODEL_PREFIX_PROVIDERS.get(model.split("-", 1)[0].lower())
+    if provider is None:
+        raise ValueError(f"Cannot detect provider from model: {model}")
 
-    raise ValueError(f"Cannot detect provider from model: {model}")
+    return provider
 
 
 def get_router_llm() -> BaseChatModel:
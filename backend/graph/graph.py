@@ -1,10 +1,16 @@
 """Main LangGraph workflow for Canada Basketball AI Agent."""
 
+import asyncio
+import hashlib
+from pathlib import Path
+
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import interrupt
+from pydantic import TypeAdapter
 
+from app.schemas.player import PlayerSearchResult
 from app.services.search_service import search_players
 from config.constants import (
     INTENT_SCOUTING_REPORT,
@@ -21,10 +27,30 @@ from config.constants import (
 from config.settings import settings
 from graph.nodes.generate_response import generate_response
 from graph.nodes.router import router
-from graph.nodes.scout import scout
+from graph.nodes.scout import prefetch_player_details, scout
 from graph.nodes.stats_lookup import stats_lookup
 from graph.state import AgentState
 
+# Top search results whose details are prefetched while the user picks a player
+SCOUTING_PREFETCH_LIMIT = 5
+
+# Serializes a whole search result list in one pass for the interrupt payload
+_SEARCH_RESULTS_ADAPTER = TypeAdapter(list[PlayerSearchResult])
+
+# Development-only graph visualization and the hash of the graph it was rendered from
+GRAPH_PNG_PATH = Path("graph.png")
+GRAPH_HASH_PATH = Path("graph.png.sha256")
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks: set[asyncio.Task] = set()
+
+# Next node per router intent; any other intent goes straight to the final response
+_INTENT_ROUTES = {
+    INTENT_TERMINATE: NODE_GENERATE_RESPONSE,
+    INTENT_STATS_QUERY: NODE_STATS_LOOKUP,
+    INTENT_SCOUTING_REPORT: NODE_CONFIRM_SCOUTING,
+}
+
 
 def route_after_router(state: AgentState) -> str:
     """
@@ -36,17 +62,7 @@ def route_after_router(state: AgentState) -> str:
     Returns:
         Node name to execute next
     """
-    intent = state.get("intent")
-
-    if intent == INTENT_TERMINATE:
-        return NODE_GENERATE_RESPONSE
-
-    if intent == INTENT_STATS_QUERY:
-        return NODE_STATS_LOOKUP
-    elif intent == INTENT_SCOUTING_REPORT:
-        return NODE_CONFIRM_SCOUTING
-    else:
-        return NODE_GENERATE_RESPONSE
+    return _INTENT_ROUTES.get(state.get("intent"), NODE_GENERATE_RESPONSE)  # type: ignore
 
 
 async def confirm_scouting_report(state: AgentState) -> dict:
@@ -74,13 +90,16 @@ async def confirm_scouting_report(state: AgentState) -> dict:
 
     try:
         leagues_list = [league.lower().replace(" ", "")] if league else None
-        search_results_objects = search_players(
+        # search_players is thread-safe (cached rosters, shared worker pool, per-thread SQLite connections),
+        # so it runs off the event loop alongside other sessions' searches and prefetches
+        search_results_objects = await asyncio.to_thread(
+            search_players,
             query=player_name,
             leagues=leagues_list,
             limit=20,
             min_score=90,
         )
-        search_results = [result.model_dump() for result in search_results_objects]
+        search_results = _SEARCH_RESULTS_ADAPTER.dump_python(search_results_objects)
 
     except Exception as e:
         return {
@@ -94,6 +113,11 @@ async def confirm_scouting_report(state: AgentState) -> dict:
             "scouting_report_confirmed": False,
         }
 
+    # Fetch the likeliest picks during the user's think time; the node re-runs on resume,
+    # where these calls are no-ops
+    for result in search_results[:SCOUTING_PREFETCH_LIMIT]:
+        prefetch_player_details(result["league"], str(result["player_id"]))
+
     user_selection = interrupt(
         {
             "type": INTERRUPT_PLAYER_SELECTION_SCOUTING,
@@ -196,13 +220,30 @@ async def build_graph(checkpointer: AsyncPostgresSaver) -> CompiledStateGraph:
 
     scouting_agent = graph.compile(checkpointer=checkpointer)
 
-    # Generate graph visualization only in development
+    # Generate graph visualization only in development, off the startup path
     if settings.environment == "development":
-        try:
-            with open("graph.png", "wb") as f:
-                graph_png = scouting_agent.get_graph().draw_mermaid_png()
-                f.write(graph_png)
-        except Exception:
-            pass
+        task = asyncio.create_task(_write_graph_png(scouting_agent))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
     return scouting_agent
+
+
+async def _write_graph_png(scouting_agent: CompiledStateGraph) -> None:
+    """
+    Render graph.png through the Mermaid API, skipping the render when the graph is unchanged.
+
+    The Mermaid source hash of the last render is stored next to the image.
+    """
+    try:
+        graph = scouting_agent.get_graph()
+        structure_hash = hashlib.sha256(graph.draw_mermaid().encode()).hexdigest()
+
+        if GRAPH_PNG_PATH.exists() and GRAPH_HASH_PATH.exists() and GRAPH_HASH_PATH.read_text() == structure_hash:
+            return
+
+        graph_png = await asyncio.to_thread(graph.draw_mermaid_png)
+        GRAPH_PNG_PATH.write_bytes(graph_png)
+        GRAPH_HASH_PATH.write_text(structure_hash)
+    except Exception:
+        pass
@@ -0,0 +1,77 @@
+"""Response cache for structured LLM calls.
+
+Entries are keyed by a SHA-256 of (model, messages, output schema) and expire after
+LLM_CACHE_TTL seconds. Use this for deterministic (temperature 0) calls, or for sampled
+calls where reusing one answer for identical inputs is intended (scouting analyses) -
+not for conversational replies that should vary.
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Sequence
+from functools import lru_cache
+
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel
+
+# Seconds a cached response stays valid
+LLM_CACHE_TTL = 3600
+# Oldest entries are evicted beyond this size
+LLM_CACHE_MAX_ENTRIES = 1024
+
+# key -> (expiry timestamp, serialized output)
+_LLM_CACHE: dict[str, tuple[float, str]] = {}
+
+
+def make_cache_key(model: str | None, messages: Sequence[BaseMessage], schema: type[BaseModel]) -> str:
+    """
+    Build the cache key for a structured LLM call.
+
+    Args:
+        model: Model name the call is sent to
+        messages: Full prompt (system prompt and conversation history)
+        schema: Structured output model
+
+    Returns:
+        Hex SHA-256 digest of the call inputs
+    """
+    payload = {
+        "model": model,
+        "messages": [(msg.type, msg.content) for msg in messages],
+        "schema": _schema_fingerprint(schema),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _schema_fingerprint(schema: type[BaseModel]) -> str:
+    """Serialized JSON schema of an output model (pydantic regenerates it on every model_json_schema call)."""
+    return json.dumps(schema.model_json_schema(), sort_keys=True)
+
+
+def get_cached_output(key: str, schema: type[BaseModel]) -> BaseModel | None:
+    """Return a fresh copy of the cached output for key, or None on a miss or expired entry."""
+    entry = _LLM_CACHE.get(key)
+    if entry is None:
+        return None
+
+    expires_at, output_json = entry
+    if expires_at < time.monotonic():
+        _LLM_CACHE.pop(key, None)
+        return None
+
+    return schema.model_validate_json(output_json)
+
+
+def set_cached_output(key: str, output: BaseModel) -> None:
+    """Store a structured output under key, evicting the oldest entry when full."""
+    if key not in _LLM_CACHE and len(_LLM_CACHE) >= LLM_CACHE_MAX_ENTRIES:
+        _LLM_CACHE.pop(next(iter(_LLM_CACHE)), None)
+
+    _LLM_CACHE[key] = (time.monotonic() + LLM_CACHE_TTL, output.model_dump_json())
+
+
+def clear_llm_cache() -> None:
+    """Drop all cached LLM responses."""
+    _LLM_CACHE.clear()
@@ -1,6 +1,7 @@
 """Generate response node: Final node that formats output based on state."""
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.messages import SystemMessage
@@ -24,6 +25,19 @@ class TextResponseOutput(BaseModel):
     main_response: str = Field(description="Natural language response to user")
 
 
+# Router query_context phrasing that means the user still has to supply details
+_CLARIFY_RE = re.compile(r"needs|clarify|missing", re.IGNORECASE)
+
+# System prompt for the common no-context case, formatted once
+_EMPTY_CONTEXT_SYSTEM_MESSAGE = SystemMessage(content=GENERATE_RESPONSE_PROMPT.format(additional_context=""))
+
+
+@lru_cache(maxsize=1)
+def _get_text_response_llm():
+    """Response LLM bound to TextResponseOutput, built once instead of re-binding the schema every turn."""
+    return get_llm(temperature=0.7).with_structured_output(TextResponseOutput)
+
+
 async def generate_response(state: AgentState) -> dict[str, Any]:
     """
     Generate final response based on state.
@@ -40,8 +54,7 @@ async def generate_response(state: AgentState) -> dict[str, Any]:
         State update with AgentResponse
     """
     intent = state.get("intent")
-    entities = state.get("entities", {})
-    query_context = entities.get("query_context") if entities else None
+    query_context = (state.get("entities") or {}).get("query_context")
     query_result = state.get("query_result")
     scouting_report = state.get("scouting_report")
     pdf_url = state.get("pdf_url")
@@ -93,21 +106,23 @@ async def generate_response(state: AgentState) -> dict[str, Any]:
         }
         return {"response": response}
 
-    llm = get_llm(temperature=0.7)
-
     additional_context = ""
     if query_context:
-        if "needs" in query_context.lower() or "clarify" in query_context.lower() or "missing" in query_context.lower():
+        if _CLARIFY_RE.search(query_context):
             additional_context = f"\n\nIMPORTANT: {query_context}\nThe user's query needs more information. Politely ask them to provide missing details (player name, league, or season)."
         else:
             additional_context = f"\n\nQuery context: {query_context}"
 
-    system_prompt = GENERATE_RESPONSE_PROMPT.format(additional_context=additional_context)
+    system_message = (
+        SystemMessage(content=GENERATE_RESPONSE_PROMPT.format(additional_context=additional_context))
+        if additional_context
+        else _EMPTY_CONTEXT_SYSTEM_MESSAGE
+    )
 
     try:
-        llm_with_struct = llm.with_structured_output(TextResponseOutput)
+        llm_with_struct = _get_text_response_llm()
         response_output: TextResponseOutput = await llm_with_struct.ainvoke(  # type: ignore
-            [SystemMessage(content=system_prompt), *state["messages"]]
+            [system_message, *state["messages"]]
         )
 
         # Strip Cohere citation tags from response
@@ -1,5 +1,7 @@
 """Router node: Intent classification and entity extraction."""
 
+import logging
+from functools import lru_cache
 from typing import Literal
 
 from langchain_core.messages import SystemMessage
@@ -15,13 +17,20 @@ from config.constants import (
     LEAGUE_HOOPQUEENS,
     LEAGUE_USPORTS,
 )
+from config.logging import get_logger
 from graph.configuration import get_router_llm
+from graph.llm_cache import get_cached_output, make_cache_key, set_cached_output
 from graph.prompts.router import ROUTER_PROMPT
 from graph.state import AgentState
 
 IntentType = Literal["stats_query", "scouting_report", "text_response", "terminate"]
 LeagueType = Literal["CEBL", "U SPORTS", "CCAA", "HoopQueens"]
 
+logger = get_logger(__name__)
+
+# Router system prompt, built once (messages are not mutated by the LLM call)
+_ROUTER_SYSTEM_MESSAGE = SystemMessage(content=ROUTER_PROMPT)
+
 
 class RouterOutput(BaseModel):
     """Structured output for router classification."""
@@ -47,6 +56,12 @@ class RouterOutput(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
+def _get_router_structured_llm():
+    """Router LLM bound to RouterOutput, built once instead of re-binding the schema every turn."""
+    return get_router_llm().with_structured_output(RouterOutput)
+
+
 async def router(state: AgentState) -> dict:
     """
     Classify user intent and extract entities with conversation awareness.
@@ -65,31 +80,42 @@ async def router(state: AgentState) -> dict:
         State update with intent, entities, player_name, league, routing_iteration
     """
     llm = get_router_llm()
-    llm_with_structured_output = llm.with_structured_output(RouterOutput)
+    llm_with_structured_output = _get_router_structured_llm()
 
     user_query = state["messages"][-1].content
     query_result = state.get("query_result")
     routing_iteration = state.get("routing_iteration", 0) + 1
 
-    print(f"\n{'=' * 80}")
-    print(f"[ROUTER] Iteration {routing_iteration}")
-    print(f"{'=' * 80}")
-    print(f"[ROUTER] Current query: {user_query[:150]}")
-    print(f"[ROUTER] Message history ({len(state['messages'])} messages):")
-    for i, msg in enumerate(state["messages"]):
-        msg_type = msg.__class__.__name__
-        content_preview = str(msg.content)[:100].replace("\n", " ")
-        print(f"  [{i}] {msg_type}: {content_preview}")
-    print(f"[ROUTER] Query result present: {query_result is not None}")
-    print(f"{'=' * 80}\n")
+    # History dump is only built when debug logging is on (can be long in multi-turn sessions)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[ROUTER] Iteration %d", routing_iteration)
+        logger.debug("[ROUTER] Current query: %s", user_query[:150])
+        logger.debug("[ROUTER] Message history (%d messages):", len(state["messages"]))
+        for i, msg in enumerate(state["messages"]):
+            # Slice before any str() coercion; tool results can be multi-KB
+            content = msg.content
+            content_preview = (content[:100] if isinstance(content, str) else repr(content)[:100]).replace("\n", " ")
+            logger.debug("  [%d] %s: %s", i, msg.__class__.__name__, content_preview)
+        logger.debug("[ROUTER] Query result present: %s", query_result is not None)
 
     try:
-        result: RouterOutput = await llm_with_structured_output.ainvoke(
-            [SystemMessage(content=ROUTER_PROMPT), *state["messages"]]
-        )  # type: ignore
-
-        print(f"[ROUTER] Intent: {result.intent}")
-        print(f"[ROUTER] Entities: player={result.player_name}, league={result.league}, season={result.season}")
+        # Router runs at temperature 0, so identical conversations always classify the same way
+        prompt = [_ROUTER_SYSTEM_MESSAGE, *state["messages"]]
+        cache_key = make_cache_key(getattr(llm, "model", None), prompt, RouterOutput)
+        result: RouterOutput = get_cached_output(cache_key, RouterOutput)  # type: ignore
+        if result is None:
+            result = await llm_with_structured_output.ainvoke(prompt)  # type: ignore
+            set_cached_output(cache_key, result)
+        else:
+            logger.debug("[ROUTER] Cache hit")
+
+        logger.info(
+            "[ROUTER] Intent: %s (player=%s, league=%s, season=%s)",
+            result.intent,
+            result.player_name,
+            result.league,
+            result.season,
+        )
 
         entities = {
             "player_name": result.player_name,
@@ -108,7 +134,7 @@ async def router(state: AgentState) -> dict:
         }
 
     except Exception as e:
-        print(f"[ROUTER ERROR] {e}")
+        logger.error("[ROUTER ERROR] %s", e)
         return {
             "intent": INTENT_TEXT_RESPONSE,
             "entities": {"query_context": "error"},
@@ -1,21 +1,25 @@
 """Scout node: Generate comprehensive scouting reports with PDF output."""
 
-import ast
+import asyncio
 import json
 import os
+import re
+import time
 import uuid
 from datetime import datetime
-from pathlib import Path
-from typing import Sequence
+from functools import lru_cache
+from typing import Any, Sequence
 
 from langchain.agents import create_agent
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 
+from app.schemas.player import PlayerDetail
 from app.services.player_service import get_player_details
 from config.pdf_constants import PDF_STORAGE_DIR
 from config.settings import settings
 from graph.configuration import get_scouting_llm
-from graph.prompts.scout import SCOUT_PROMPT
+from graph.llm_cache import get_cached_output, make_cache_key, set_cached_output
+from graph.prompts.scout import SCOUT_CONTEXT_PROMPT, SCOUT_PROMPT
 from graph.schemas.scouting import (
     League,
     PlayerProfile,
@@ -24,7 +28,158 @@ from graph.schemas.scouting import (
 )
 from graph.state import AgentState
 from graph.tools.pdf_generator.pdf_generator import PDFGenerator
-from graph.utils.gcs_helpers import GCS_FOLDER_NAME, upload_pdf_to_gcs
+from graph.utils.gcs_helpers import GCS_FOLDER_NAME, upload_pdf_bytes_to_gcs
+from graph.utils.llm_errors import extract_error_message
+
+# Seconds a fetched (or prefetched) player detail stays reusable by the scout node
+PLAYER_DETAIL_TTL = 600
+# Oldest entries are evicted beyond this many players
+PLAYER_DETAIL_CACHE_SIZE = 256
+
+# Lowercased league names/values (as sent by the router or frontend) -> League
+_LEAGUE_MAP = {
+    "cebl": League.CEBL,
+    "usports": League.USPORTS,
+    "u sports": League.USPORTS,
+    "ccaa": League.CCAA,
+    "ocaa": League.OCAA,
+    "pacwest": League.PACWEST,
+    "hoopqueens": League.HOOPQUEENS,
+}
+# League -> database/API league identifier
+_LEAGUE_PATHS = {league: league.value.lower().replace(" ", "") for league in League}
+
+# Analysis cache key -> in-flight scouting agent run (removed once it finishes)
+_inflight_analyses: dict[str, asyncio.Task[ScoutingAnalysis]] = {}
+
+# Characters replaced with "_" when a player name is used in a PDF file name
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w \-]")
+
+# (league, player_id) -> (expiry timestamp, in-flight or finished get_player_details task)
+_player_detail_cache: dict[tuple[str, str], tuple[float, asyncio.Task[PlayerDetail | None]]] = {}
+
+# (league, player_id) -> (detail object, model_dump, indented JSON) for the detail currently served from the cache
+_player_detail_json: dict[tuple[str, str], tuple[PlayerDetail, dict, str]] = {}
+
+
+def _get_player_details_task(league: str, player_id: str) -> asyncio.Task[PlayerDetail | None]:
+    """
+    Get the shared fetch task for a player's details, starting one if none is cached.
+
+    Concurrent callers for the same player share one in-flight task (single flight).
+    Failed or empty fetches are evicted when they finish so the next call retries.
+    """
+    now = time.monotonic()
+    for key in [key for key, (expires_at, _) in _player_detail_cache.items() if expires_at < now]:
+        del _player_detail_cache[key]
+
+    key = (league, player_id)
+    entry = _player_detail_cache.get(key)
+    if entry:
+        return entry[1]
+
+    if len(_player_detail_cache) >= PLAYER_DETAIL_CACHE_SIZE:
+        del _player_detail_cache[next(iter(_player_detail_cache))]
+
+    task = asyncio.create_task(get_player_details(league, player_id))
+
+    def _evict_failed(t: asyncio.Task[PlayerDetail | None]) -> None:
+        # Also retrieves the exception so unused prefetches don't log "exception was never retrieved"
+        if t.cancelled() or t.exception() is not None or t.result() is None:
+            cached = _player_detail_cache.get(key)
+            if cached and cached[1] is t:
+                del _player_detail_cache[key]
+
+    task.add_done_callback(_evict_failed)
+    _player_detail_cache[key] = (now + PLAYER_DETAIL_TTL, task)
+    return task
+
+
+def prefetch_player_details(league: str, player_id: str) -> None:
+    """
+    Start fetching a player's details in the background for a likely scouting request.
+
+    Called while the user is still choosing a player, so the scout node can pick up the
+    result instead of querying the league database after confirmation. Repeated calls for
+    the same player are no-ops until the entry expires.
+
+    Args:
+        league: League identifier (usports, ccaa, cebl, hoopqueens)
+        player_id: Player ID within the league
+    """
+    _get_player_details_task(league, player_id)
+
+
+async def get_player_details_cached(league: str, player_id: str) -> PlayerDetail | None:
+    """
+    Get player details, reusing a cached, pending or prefetched fetch when one exists.
+
+    Args:
+        league: League identifier (usports, ccaa, cebl, hoopqueens)
+        player_id: Player ID within the league
+
+    Returns:
+        PlayerDetail or None if the player was not found
+    """
+    # Shielded so a cancelled request doesn't cancel the fetch other callers are waiting on
+    return await asyncio.shield(_get_player_details_task(league, player_id))
+
+
+def _serialize_player_detail(league: str, player_id: str, player_detail: PlayerDetail) -> tuple[dict, str]:
+    """
+    Dump a player detail to a dict and indented JSON, reusing both while the same cached detail is served.
+
+    Args:
+        league: League identifier (usports, ccaa, cebl, hoopqueens)
+        player_id: Player ID within the league
+        player_detail: Detail returned by get_player_details_cached
+
+    Returns:
+        Tuple of (JSON-mode dict, indented JSON string)
+    """
+    key = (league, player_id)
+    cached = _player_detail_json.get(key)
+    if cached is not None and cached[0] is player_detail:
+        return cached[1], cached[2]
+
+    detail_dict = player_detail.model_dump(mode="json")
+    detail_json = json.dumps(detail_dict, indent=2)
+
+    if key not in _player_detail_json and len(_player_detail_json) >= PLAYER_DETAIL_CACHE_SIZE:
+        _player_detail_json.pop(next(iter(_player_detail_json)), None)
+    _player_detail_json[key] = (player_detail, detail_dict, detail_json)
+    return detail_dict, detail_json
+
+
+def clear_player_detail_cache() -> None:
+    """Drop cached player details and their serialized forms (e.g. after an ETL refresh)."""
+    _player_detail_cache.clear()
+    _player_detail_json.clear()
+
+
+@lru_cache(maxsize=1)
+def _get_scout_agent() -> tuple[Any, Any]:
+    """Scouting LLM and its compiled agent, built once (the system prompt is static)."""
+    llm = get_scouting_llm(temperature=0.3)
+    agent = create_agent(
+        llm,
+        tools=[],
+        system_prompt=SCOUT_PROMPT,
+        response_format=ScoutingAnalysis,
+    )
+    return llm, agent
+
+
+async def _run_scouting_analysis(agent: Any, human_message: HumanMessage, cache_key: str) -> ScoutingAnalysis:
+    """Run the scouting agent once and cache its analysis under cache_key."""
+    result = await agent.ainvoke({"messages": [human_message]})
+
+    if "structured_response" not in result:
+        raise ValueError("Agent did not return structured_response")
+
+    scouting_analysis: ScoutingAnalysis = result["structured_response"]
+    set_cached_output(cache_key, scouting_analysis)
+    return scouting_analysis
 
 
 def _summarize_conversation(messages: Sequence[BaseMessage]) -> str:
@@ -36,7 +191,8 @@ def _summarize_conversation(messages: Sequence[BaseMessage]) -> str:
     lines = ["**Recent Conversation:**"]
     for msg in recent:
         role = "User" if msg.type == "human" else "Assistant"
-        content = str(msg.content)[:150]
+        # Truncate string content before formatting; only non-string (block) content needs str()
+        content = msg.content[:150] if isinstance(msg.content, str) else str(msg.content)[:150]
         lines.append(f"- {role}: {content}")
     return "\n".join(lines)
 
@@ -93,28 +249,17 @@ async def scout(state: AgentState) -> dict:
             "messages": [AIMessage(content="**Scouting Error**: Missing player information.")],
         }
 
-    try:
-        league = League(league_str)
-    except (ValueError, TypeError):
-        league_map = {
-            "cebl": League.CEBL,
-            "usports": League.USPORTS,
-            "u sports": League.USPORTS,
-            "ccaa": League.CCAA,
-            "ocaa": League.OCAA,
-            "pacwest": League.PACWEST,
-            "hoopqueens": League.HOOPQUEENS,
-        }
-        league = league_map.get(str(league_str).lower(), League.CEBL)
+    league = _LEAGUE_MAP.get(str(league_str).lower(), League.CEBL)
 
     try:
-        league_path = league.value.lower().replace(" ", "")
-        player_detail = await get_player_details(league_path, str(player_id))
+        league_path = _LEAGUE_PATHS[league]
+        player_detail = await get_player_details_cached(league_path, str(player_id))
+        conversation_summary = _summarize_conversation(messages)
 
         if not player_detail:
             raise ValueError(f"Player not found: {player_id} in {league_path}")
 
-        player_detail_dict = player_detail.model_dump(mode="json")
+        player_detail_dict, player_detail_json = _serialize_player_detail(league_path, str(player_id), player_detail)
 
     except Exception as e:
         return {
@@ -124,47 +269,34 @@ async def scout(state: AgentState) -> dict:
             "messages": [AIMessage(content=f"**Scouting Error**: {str(e)}")],
         }
 
-    conversation_summary = _summarize_conversation(messages)
-
     try:
-        llm = get_scouting_llm(temperature=0.3)
+        llm, agent = _get_scout_agent()
 
-        system_message = SCOUT_PROMPT.format(
-            player_detail=json.dumps(player_detail_dict, indent=2),
-            conversation_summary=conversation_summary,
+        human_message = HumanMessage(
+            content=SCOUT_CONTEXT_PROMPT.format(
+                player_detail=player_detail_json,
+                conversation_summary=conversation_summary,
+                player_name=player_name,
+            )
         )
 
-        agent = create_agent(
-            llm,
-            tools=[],
-            system_prompt=system_message,
-            response_format=ScoutingAnalysis,
+        # Identical inputs (same player detail and conversation) reuse the previous analysis
+        cache_key = make_cache_key(
+            getattr(llm, "model", None), [SystemMessage(content=SCOUT_PROMPT), human_message], ScoutingAnalysis
         )
+        scouting_analysis: ScoutingAnalysis | None = get_cached_output(cache_key, ScoutingAnalysis)  # type: ignore
 
-        agent_input = {
-            "messages": [HumanMessage(content=f"Generate a comprehensive scouting analysis for {player_name}.")]
-        }
-
-        result = await agent.ainvoke(agent_input)  # type: ignore
-
-        if "structured_response" not in result:
-            raise ValueError("Agent did not return structured_response")
-
-        scouting_analysis: ScoutingAnalysis = result["structured_response"]
+        if scouting_analysis is None:
+            # Concurrent identical requests share one agent run instead of each calling the LLM
+            task = _inflight_analyses.get(cache_key)
+            if task is None:
+                task = asyncio.create_task(_run_scouting_analysis(agent, human_message, cache_key))
+                _inflight_analyses[cache_key] = task
+                task.add_done_callback(lambda _task, key=cache_key: _inflight_analyses.pop(key, None))
+            scouting_analysis = await asyncio.shield(task)
 
     except Exception as e:
-        error_str = str(e)
-        if "message" in error_str:
-            # Try to extract message from JSON-like string
-            try:
-                error_dict = ast.literal_eval(error_str.split("body: ")[-1])
-                error_message = error_dict.get("message", error_str)
-            except Exception:
-                error_message = error_str
-        else:
-            error_message = error_str
-
-        error_message = error_message[:500]  # Truncate to first 500 chars
+        error_message = extract_error_message(str(e))[:500]  # Truncate to first 500 chars
 
         return {
             "error": f"Scouting analysis generation failed: {str(error_message)}",
@@ -173,15 +305,14 @@ async def scout(state: AgentState) -> dict:
             "messages": [AIMessage(content=f"**Scouting Error**: Analysis failed - {str(e)}")],
         }
 
-    try:
-        from app.schemas.player import PlayerDetail
+    generated_at = datetime.now()
 
-        player_detail = PlayerDetail(**player_detail_dict)
+    try:
         player_profile = _build_player_profile(player_detail_dict, league)
 
         scouting_report = ScoutingReport(
             report_id=str(uuid.uuid4()),
-            generated_at=datetime.now(),
+            generated_at=generated_at,
             player_profile=player_profile,
             player_detail=player_detail,
             archetype=scouting_analysis.archetype,
@@ -202,59 +333,49 @@ async def scout(state: AgentState) -> dict:
             "messages": [AIMessage(content=f"**Scouting Error**: Report build failed - {str(e)}")],
         }
 
+    # Built before the PDF step; only the availability line depends on the upload
+    ai_summary = f"**Scouting Report Generated** for {player_name} ({league.value}):\n"
+    ai_summary += f"- Archetype: {scouting_report.archetype}\n"
+    ai_summary += f"- Strengths: {len(scouting_report.strengths)} identified\n"
+    ai_summary += f"- Weaknesses: {len(scouting_report.weaknesses)} identified\n"
+
     pdf_url = None
 
     try:
         pdf_data = scouting_report.model_dump(mode="json")
         pdf_generator = PDFGenerator()
-        safe_player_name = (
-            "".join(
-                c if c.isalnum() or c in (" ", "-") else "_"
-                for c in player_name  # type: ignore
-            ).strip()
-            or "Unknown_Player"
-        )
-        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        pdf_title = f"Scouting_Report_{safe_player_name.replace(' ', '_')}_{date_str}"
-        pdf_path = await pdf_generator.generate_pdf(data=pdf_data, pdf_title=pdf_title, width="816px")
+        safe_player_name = _UNSAFE_FILENAME_RE.sub("_", player_name or "").strip() or "Unknown_Player"
+        file_stem = safe_player_name.replace(" ", "-").lower()
+        date_str = generated_at.strftime("%Y%m%d_%H%M%S")
+        # Rendered in memory and uploaded directly; only the local fallback touches disk
+        pdf_bytes = await pdf_generator.generate_pdf_bytes(data=pdf_data, width="816px")
 
         try:
             print(f"[PDF] Attempting GCS upload for {safe_player_name}")
-            pdf_url = upload_pdf_to_gcs(
-                local_pdf_path=pdf_path,
-                destination_blob_name=f"{GCS_FOLDER_NAME}/{safe_player_name.replace(' ', '-').lower()}_{date_str}.pdf",
+            # Upload and URL signing are blocking network calls; keep them off the event loop
+            pdf_url = await asyncio.to_thread(
+                upload_pdf_bytes_to_gcs,
+                pdf_bytes,
+                destination_blob_name=f"{GCS_FOLDER_NAME}/{file_stem}_{date_str}.pdf",
             )
             print(f"[PDF] Signed URL generated: {pdf_url[:100]}...")
 
-            if Path(pdf_path).exists():
-                Path(pdf_path).unlink()
-
         except Exception as gcs_error:
             print(f"[PDF] GCS upload failed: {type(gcs_error).__name__}: {str(gcs_error)}")
             print("[PDF] Falling back to local storage")
             print(f"[PDF] GOOGLE_APPLICATION_CREDENTIALS: {os.getenv('GOOGLE_APPLICATION_CREDENTIALS')}")
             print(f"[PDF] GCS_BUCKET_NAME: {os.getenv('GCS_BUCKET_NAME', 'canada-basketball-scouting-reports')}")
 
-            local_filename = f"{safe_player_name.replace(' ', '-').lower()}.pdf"
+            local_filename = f"{file_stem}.pdf"
             local_pdf_path = PDF_STORAGE_DIR / local_filename
-
-            import shutil
-
-            shutil.copy(pdf_path, local_pdf_path)
+            local_pdf_path.write_bytes(pdf_bytes)
             # Use absolute URL with API_BASE_URL to ensure it works in production
             pdf_url = f"{api_base}/api/pdf/{PDF_STORAGE_DIR.name}/{local_filename}"
             print(f"[PDF] Local fallback URL: {pdf_url}")
 
-            if Path(pdf_path).exists():
-                Path(pdf_path).unlink()
-
     except Exception:
         pdf_url = None
 
-    ai_summary = f"**Scouting Report Generated** for {player_name} ({league.value}):\n"
-    ai_summary += f"- Archetype: {scouting_report.archetype}\n"
-    ai_summary += f"- Strengths: {len(scouting_report.strengths)} identified\n"
-    ai_summary += f"- Weaknesses: {len(scouting_report.weaknesses)} identified\n"
     ai_summary += f"- PDF: {'Available' if pdf_url else 'Generation failed'}"
 
     return {
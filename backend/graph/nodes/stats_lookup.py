@@ -1,43 +1,163 @@
 """Stats lookup node: SQL agent with structured output."""
 
-import ast
 import json
 import os
-
+from contextvars import ContextVar
+from typing import Any
 
 from langchain.agents import create_agent
 from langchain_community.agent_toolkits import SQLDatabaseToolkit
+from langchain_community.tools.sql_database.tool import QuerySQLDatabaseTool
 from langchain_community.utilities import SQLDatabase
-from langchain_core.messages import AIMessage
+from langchain_community.utilities.sql_database import truncate_word
+from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.messages import AIMessage, HumanMessage
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.exc import SQLAlchemyError
 
 from config.constants import LEAGUE_DB_MAP
 from graph.configuration import get_sql_llm
-from graph.prompts.stats_lookup import SQL_AGENT_PROMPT
+from graph.prompts.stats_lookup import SQL_AGENT_CONTEXT_PROMPT, SQL_AGENT_PROMPT
 from graph.schemas.visualization import QueryResult, SQLAgentResponse
 from graph.state import AgentState
+from graph.utils.llm_errors import extract_error_message
+
+# SQL text -> rows for queries executed during the current stats_lookup call (set per request)
+_executed_rows: ContextVar[dict[str, list[dict]] | None] = ContextVar("executed_rows", default=None)
+
+
+# Bytes of each database file SQLite may memory-map for reads
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+# Values in sql_db_query tool output are cut to this many characters (SQLDatabase's default)
+TOOL_MAX_STRING_LENGTH = 300
+
+
+def execute_sql(engine: Engine, query: str) -> list[dict[str, Any]]:
+    """
+    Run a SQL query and return its rows.
+
+    Args:
+        engine: SQLAlchemy engine of a league database
+        query: SQL text
+
+    Returns:
+        List of rows as dicts (column name -> value)
+    """
+    with engine.connect() as conn:
+        return [dict(row) for row in conn.execute(text(query)).mappings()]
+
+
+class RecordingQuerySQLDatabaseTool(QuerySQLDatabaseTool):
+    """
+    sql_db_query tool that also keeps the rows of each query run during a stats_lookup call.
 
+    The agent executes its final query through this tool already; recording the rows lets
+    stats_lookup return them instead of running the same SQL a second time.
+    """
+
+    engine: Engine
+
+    def _run(self, query: str, run_manager: CallbackManagerForToolRun | None = None) -> str:
+        try:
+            rows = execute_sql(self.engine, query)
+        except SQLAlchemyError as e:
+            return f"Error: {e}"
+
+        recorded = _executed_rows.get()
+        if recorded is not None:
+            recorded[query.strip()] = rows
+
+        # Same text the stock tool gives the agent (SQLDatabase.run without column names)
+        if not rows:
+            return ""
+        return str(
+            [tuple(truncate_word(value, length=TOOL_MAX_STRING_LENGTH) for value in row.values()) for row in rows]
+        )
+
+
+class CachedSchemaSQLDatabase(SQLDatabase):
+    """SQLDatabase that reflects table info once per table set (the league databases are static)."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Sorted table names (None = all usable tables) -> get_table_info output
+        self._table_info_cache: dict[tuple[str, ...] | None, str] = {}
+
+    def get_table_info(self, table_names: list[str] | None = None) -> str:
+        """Schema + sample rows for table_names, reflected once per table set (the databases are static)."""
+        key = tuple(sorted(table_names)) if table_names else None
+        if key not in self._table_info_cache:
+            self._table_info_cache[key] = super().get_table_info(table_names)
+        return self._table_info_cache[key]
+
+
+def _configure_sqlite_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Per-connection pragmas for the read-only league databases (WAL/synchronous do not apply without writes)."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.close()
+
+
+_engine_cache: dict[str, Engine] = {}
 _db_cache: dict[str, SQLDatabase] = {}
+_agent_cache: dict[str, Any] = {}
+
+
+def get_db_engine(league: str) -> Engine:
+    """Get the cached read-only SQLAlchemy engine for a league database."""
+    if league not in _engine_cache:
+        db_path = os.path.join(os.getcwd(), "db", f"{league}.db")
+        # Read-only URI; pooled connections are shared across the agent's tool threads
+        engine = create_engine(
+            f"sqlite:///file:{db_path}?mode=ro&uri=true",
+            connect_args={"check_same_thread": False},
+        )
+        event.listen(engine, "connect", _configure_sqlite_connection)
+        _engine_cache[league] = engine
+    return _engine_cache[league]
 
 
 def get_db_connection(league: str) -> SQLDatabase:
     """Get cached database connection with read-only enforcement."""
     if league not in _db_cache:
-        db_path = os.path.join(os.getcwd(), "db", f"{league}.db")
-        _db_cache[league] = SQLDatabase.from_uri(
-            f"sqlite:///{db_path}",
+        _db_cache[league] = CachedSchemaSQLDatabase(
+            get_db_engine(league),
             view_support=True,
             sample_rows_in_table_info=3,
         )
     return _db_cache[league]
 
 
+def get_sql_agent(db_name: str) -> Any:
+    """Get the cached SQL agent (toolkit, tools and compiled agent graph) for a league database."""
+    if db_name not in _agent_cache:
+        db = get_db_connection(db_name)
+        llm = get_sql_llm()
+        toolkit = SQLDatabaseToolkit(db=db, llm=llm)
+        # Swap in the recording query tool, keeping the toolkit's name and description for the agent
+        tools = [
+            RecordingQuerySQLDatabaseTool(db=db, engine=get_db_engine(db_name), description=tool.description)
+            if isinstance(tool, QuerySQLDatabaseTool)
+            else tool
+            for tool in toolkit.get_tools()
+        ]
+        _agent_cache[db_name] = create_agent(
+            llm,
+            tools,
+            system_prompt=SQL_AGENT_PROMPT,
+            response_format=SQLAgentResponse,
+        )
+    return _agent_cache[db_name]
+
+
 async def stats_lookup(state: AgentState) -> dict:
     """
     Execute SQL query and return structured results with chart config.
 
     Process:
     1. SQL agent queries database and returns SQLAgentResponse
-    2. Extract sql_query and re-run to get clean data as list[dict]
+    2. Take the rows of the agent's final sql_query from its tool run (re-run only if not recorded)
     3. Build QueryResult with data + chart_config + summary_text
     4. Append AI message summarizing query and results
 
@@ -55,12 +175,10 @@ async def stats_lookup(state: AgentState) -> dict:
     db_name = LEAGUE_DB_MAP.get(league, "cebl")
 
     try:
-        db = get_db_connection(db_name)
-        llm = get_sql_llm()
-        toolkit = SQLDatabaseToolkit(db=db, llm=llm)
-        tools = toolkit.get_tools()
+        agent = get_sql_agent(db_name)
 
-        system_message = SQL_AGENT_PROMPT.format(
+        # Per-request context follows the conversation so the agent's system prompt stays static
+        task_context = SQL_AGENT_CONTEXT_PROMPT.format(
             db_name=db_name,
             league=league.upper(),
             season=season,
@@ -69,34 +187,27 @@ async def stats_lookup(state: AgentState) -> dict:
             entities=json.dumps(entities, indent=2),
         )
 
-        agent = create_agent(
-            llm,
-            tools,
-            system_prompt=system_message,
-            response_format=SQLAgentResponse,
-        )
-
-        agent_input = {"messages": state["messages"]}
-        result = await agent.ainvoke(agent_input)  # type: ignore
+        agent_input = {"messages": [*state["messages"], HumanMessage(content=task_context)]}
+        # Tool runs mutate this dict in place, so it is visible here even from copied contexts
+        executed_rows: dict[str, list[dict]] = {}
+        token = _executed_rows.set(executed_rows)
+        try:
+            result = await agent.ainvoke(agent_input)  # type: ignore
+        finally:
+            _executed_rows.reset(token)
 
         if "structured_response" not in result:
             raise ValueError("Agent did not return structured_response")
 
         agent_response: SQLAgentResponse = result["structured_response"]
 
-        try:
-            raw_results = db.run(agent_response.sql_query, fetch="all", include_columns=True)
-
-            if isinstance(raw_results, str):
-                query_data = ast.literal_eval(raw_results)
-            elif isinstance(raw_results, dict) and "result" in raw_results:
-                query_data = raw_results["result"]  # type: ignore
-            elif isinstance(raw_results, list):
-                query_data = raw_results
-            else:
+        # Rows of the final query are normally recorded from the agent's own tool run
+        query_data = executed_rows.get(agent_response.sql_query.strip())
+        if query_data is None:
+            try:
+                query_data = execute_sql(get_db_engine(db_name), agent_response.sql_query)
+            except Exception:
                 query_data = []
-        except Exception:
-            query_data = []
 
         query_result = QueryResult(
             data=query_data,  # type: ignore
@@ -119,18 +230,7 @@ async def stats_lookup(state: AgentState) -> dict:
         }
 
     except Exception as e:
-        error_str = str(e)
-        if "message" in error_str:
-            # Try to extract message from JSON-like string
-            try:
-                error_dict = ast.literal_eval(error_str.split("body: ")[-1])
-                error_message = error_dict.get("message", error_str)
-            except Exception:
-                error_message = error_str
-        else:
-            error_message = error_str
-
-        error_message = error_message[:500]  # Truncate to first 500 chars
+        error_message = extract_error_message(str(e))[:500]  # Truncate to first 500 chars
 
         error_msg = f"Stats lookup failed: {error_message}"
         error_result = QueryResult(
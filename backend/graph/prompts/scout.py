@@ -1,4 +1,7 @@
-"""Scout node system prompt for generating comprehensive scouting analysis."""
+"""Scout node prompts for generating comprehensive scouting analysis.
+
+SCOUT_PROMPT is the static system prompt; per-request player data goes in SCOUT_CONTEXT_PROMPT.
+"""
 
 SCOUT_PROMPT = """You are an elite basketball scout for Canada Basketball, evaluating talent across domestic leagues (CEBL, U SPORTS, CCAA, HoopQueens) for national team consideration.
 
@@ -104,9 +107,11 @@ TONE AND STYLE
 - **Forward-looking** - Upside and development needs
 - **Canadian context** - Fit in Canadian basketball ecosystem
 
-═══════════════════════════════════════════════════════════════════════════
-PLAYER DATA
-═══════════════════════════════════════════════════════════════════════════
+The player data and recent conversation are provided in the PLAYER DATA message.
+"""
+
+# Per-request half of the scouting prompt, sent as the human message so SCOUT_PROMPT stays static
+SCOUT_CONTEXT_PROMPT = """PLAYER DATA
 
 {player_detail}
 
@@ -114,5 +119,5 @@ PLAYER DATA
 
 Use player data and conversation history to generate evidence-based assessments. Reference specific stats, percentiles, and metrics. Consider user preferences from previous messages.
 
-Generate comprehensive scouting analysis following all requirements above.
+Generate a comprehensive scouting analysis for {player_name} following all requirements above.
 """
@@ -1,16 +1,12 @@
-"""Stats lookup node system prompt for SQL agent with chart generation."""
+"""Stats lookup node system prompt for SQL agent with chart generation.
 
-SQL_AGENT_PROMPT = """You are an expert SQL agent for Canadian basketball statistics.
-
-DATABASE CONTEXT:
-- Database: {db_name}
-- League: {league}
-- Season: {season}
+The system prompt is static, so the SQL agent can be built once per database and every
+request shares the same prompt prefix (reused by providers with implicit prefix caching,
+e.g. Gemini 2.5). Per-request values go in SQL_AGENT_CONTEXT_PROMPT, sent as the last message.
+"""
 
-USER REQUEST:
-- Query: {user_query}
-- Intent: {intent}
-- Entities: {entities}
+SQL_AGENT_PROMPT = """You are an expert SQL agent for Canadian basketball statistics.
+The database and user request for this task are given in the TASK CONTEXT message.
 
 YOUR TASK:
 1. List available tables using sql_db_list_tables
@@ -19,7 +15,7 @@ YOUR TASK:
 4. Execute the query using sql_db_query
 5. Return SQLAgentResponse with:
    - sql_query: The final SQL query you executed
-   - db_name: "{db_name}"
+   - db_name: The Database value from DATABASE CONTEXT
    - chart_config: Appropriate chart configuration (or null for table-only)
    - summary_text: Natural language summary of results
 
@@ -101,3 +97,16 @@ SAFETY
 Return SQLAgentResponse with all four fields populated.
 Always return a column of player full name if applicable. usports and ccaa requires using the first_nam_initials and last_name columns
 """
+
+SQL_AGENT_CONTEXT_PROMPT = """TASK CONTEXT
+
+DATABASE CONTEXT:
+- Database: {db_name}
+- League: {league}
+- Season: {season}
+
+USER REQUEST:
+- Query: {user_query}
+- Intent: {intent}
+- Entities: {entities}
+"""
@@ -175,6 +175,11 @@ class ScoutingAnalysis(BaseModel):
 # ============================================================================
 
 
+def _new_report_id() -> str:
+    """Default report ID from the current local time (e.g. SR-20250101120000)."""
+    return f"SR-{datetime.now():%Y%m%d%H%M%S}"
+
+
 class ScoutingReport(BaseModel):
     """
     Comprehensive scouting report for Canada Basketball talent identification.
@@ -189,7 +194,7 @@ class ScoutingReport(BaseModel):
     the FastAPI /api/stats/player endpoint.
     """
 
-    report_id: str = Field(default_factory=lambda: f"SR-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+    report_id: str = Field(default_factory=_new_report_id)
     generated_at: datetime = Field(default_factory=datetime.now)
 
     # Core Player Information
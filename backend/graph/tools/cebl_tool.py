@@ -1,7 +1,33 @@
 """CEBL SDK tool for biographical player data."""
 
+import asyncio
+from typing import Any
+
 from pydantic import BaseModel, Field
 
+# Shared CEBL SDK client (created on first use so its HTTP session is reused across tool calls)
+_client: Any = None
+_client_lock = asyncio.Lock()
+
+
+async def _get_client() -> Any:
+    """
+    Get the shared CEBL SDK client, creating it on first use.
+
+    Raises:
+        ImportError: If the CEBL SDK is not installed
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    async with _client_lock:
+        if _client is None:
+            from cebl import CEBLClient as Client
+
+            _client = Client(CEBL_API_KEY="public_access")
+        return _client
+
 
 class CEBLPlayerInfoInput(BaseModel):
     """Input schema for CEBL player info tool (flat Pydantic, no nested JSON)."""
@@ -42,9 +68,7 @@ async def get_cebl_player_info(player_id: int) -> dict:
         }
     """
     try:
-        from cebl import CEBLClient as Client
-
-        client = Client(CEBL_API_KEY="public_access")
+        client = await _get_client()
 
         # Fetch player profile using player_id
         player_data = await client.get_player(player_id)
@@ -1,9 +1,48 @@
+import asyncio
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import Browser, Page, Playwright, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# Characters stripped from PDF titles (keeps letters, digits, spaces, "-" and "_")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w \-]")
+
+# One Chromium process shared by all renders; each render gets its own browser context
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+_browser_lock = asyncio.Lock()
+
+
+async def _get_browser() -> Browser:
+    """Return the shared Chromium browser, launching it on first use or after it disconnects."""
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(args=["--no-sandbox", "--disable-dev-shm-usage"])
+        return _browser
+
+
+async def start_shared_browser() -> None:
+    """Launch the shared browser ahead of the first render (call on application startup)."""
+    await _get_browser()
+
+
+async def close_shared_browser() -> None:
+    """Close the shared browser and stop Playwright (call on application shutdown)."""
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
 
 
 class PDFGenerator:
@@ -46,7 +85,7 @@ class PDFGenerator:
         return data_with_date
 
     def _ensure_pdf_extension(self, filename: str) -> str:
-        safe_filename = "".join(c for c in filename if c.isalnum() or c in (" ", "-", "_")).strip()
+        safe_filename = _UNSAFE_FILENAME_RE.sub("", filename).strip()
         if not safe_filename:
             safe_filename = "output"
 
@@ -72,6 +111,20 @@ class PDFGenerator:
         return template_path
 
     async def generate_pdf(self, data: dict[str, Any], pdf_title: str, width: str = "816px", **pdf_options) -> Path:
+        output_path = Path(self._ensure_pdf_extension(pdf_title)).resolve()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        await self._render_pdf(data, width, output_path, **pdf_options)
+        print(f"PDF generated: {output_path}")
+        return output_path
+
+    async def generate_pdf_bytes(self, data: dict[str, Any], width: str = "816px", **pdf_options) -> bytes:
+        """Render the PDF in memory without writing it to disk (e.g. for direct upload)."""
+        pdf_bytes = await self._render_pdf(data, width, None, **pdf_options)
+        print(f"PDF generated in memory: {len(pdf_bytes)} bytes")
+        return pdf_bytes
+
+    async def _render_pdf(self, data: dict[str, Any], width: str, output_path: Path | None, **pdf_options) -> bytes:
         if not isinstance(data, dict):
             raise ValueError("Data must be a dictionary")
 
@@ -79,12 +132,12 @@ class PDFGenerator:
         if "current_date" not in data:
             data = self._add_current_date(data)
 
-        output_pdf = self._ensure_pdf_extension(pdf_title)
         html_path = self._validate_template_path()
 
-        async with async_playwright() as p:
-            browser: Browser = await p.chromium.launch(args=["--no-sandbox", "--disable-dev-shm-usage"])
-            page: Page = await browser.new_page()
+        browser = await _get_browser()
+        context = await browser.new_context()
+        try:
+            page: Page = await context.new_page()
 
             await page.set_extra_http_headers(
                 {"Content-Security-Policy": "default-src 'self'; script-src 'self' 'unsafe-inline';"}
@@ -107,19 +160,20 @@ class PDFGenerator:
             # Wait for final recommendation section to be populated
             await page.wait_for_selector("#final-recommendation-section", timeout=10000)
 
-            # Wait for charts to fully render
-            await page.wait_for_timeout(1000)
+            # Wait for the template's ready signal (charts drawn, late images loaded); render anyway if it never comes
+            try:
+                await page.wait_for_function("window.__reportReady === true", timeout=5000)
+            except PlaywrightTimeoutError:
+                print("PDF render: ready signal timed out, rendering current state")
 
             await page.set_viewport_size({"width": 816, "height": 2600})
             await page.emulate_media(media="screen")
 
             content_height = await page.evaluate("document.documentElement.scrollHeight")
 
-            output_path = Path(output_pdf).resolve()
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            await page.pdf(
-                path=str(output_path),
+            # Playwright returns the PDF bytes and also writes them when a path is given
+            pdf_bytes = await page.pdf(
+                path=str(output_path) if output_path else None,
                 width=width,
                 height=f"{content_height}px",
                 print_background=True,
@@ -128,10 +182,9 @@ class PDFGenerator:
                 **pdf_options,
                 margin={"top": "0", "right": "0", "bottom": "0", "left": "0"},
             )
-
-            await browser.close()
-            print(f"PDF generated: {output_path}")
-            return output_path
+            return pdf_bytes
+        finally:
+            await context.close()
 
 
 class SecurityError(Exception):
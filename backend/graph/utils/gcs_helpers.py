@@ -1,5 +1,6 @@
 """Google Cloud Storage helpers for PDF upload and signed URL generation."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from google.cloud import storage
@@ -10,10 +11,14 @@ from config.settings import settings
 GCS_FOLDER_NAME = "scouting-reports"
 
 
+@lru_cache(maxsize=1)
 def _get_gcs_client() -> storage.Client:
     """
     Get authenticated GCS client using service account or default credentials.
 
+    The client is built once per process so its credentials and HTTP connection pool are
+    reused across uploads.
+
     Tries multiple authentication methods in order:
     1. Service account JSON file (if GOOGLE_APPLICATION_CREDENTIALS is set)
     2. Default credentials (Cloud Run workload identity, ADC, gcloud auth, etc.)
@@ -81,3 +86,30 @@ def upload_pdf_to_gcs(local_pdf_path: Path | str, destination_blob_name: str | N
 
     except Exception as e:
         raise Exception(f"Failed to upload PDF to GCS: {str(e)}") from e
+
+
+def upload_pdf_bytes_to_gcs(pdf_bytes: bytes, destination_blob_name: str) -> str:
+    """
+    Upload an in-memory PDF to Google Cloud Storage.
+
+    Args:
+        pdf_bytes: Rendered PDF content
+        destination_blob_name: Name for the file in GCS (e.g., "scouting-reports/aaron-best-2024.pdf")
+
+    Returns:
+        Public URL of the uploaded file.
+
+    Raises:
+        RuntimeError: If upload fails
+    """
+    try:
+        client = _get_gcs_client()
+        bucket = client.bucket(settings.gcs_bucket_name)
+        blob = bucket.blob(destination_blob_name)
+
+        blob.upload_from_string(pdf_bytes, content_type="application/pdf")
+
+        return blob.public_url
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to upload PDF to GCS: {e}") from e
@@ -0,0 +1,35 @@
+"""Helpers for turning LLM provider exceptions into short user-facing messages."""
+
+import json
+import re
+
+# Provider errors embed the response payload after "body: " (JSON or a Python dict repr)
+_ERROR_BODY_RE = re.compile(r"body:\s*(\{.*\})", re.DOTALL)
+# "message" field of a dict repr, single- or double-quoted
+_ERROR_MESSAGE_RE = re.compile(r"""["']message["']\s*:\s*(["'])((?:\\.|(?!\1).)*)\1""", re.DOTALL)
+
+
+def extract_error_message(error_str: str) -> str:
+    """
+    Extract the provider's "message" field from a stringified LLM exception.
+
+    Args:
+        error_str: str() of the raised exception
+
+    Returns:
+        The message from the error body, or error_str when none can be found
+    """
+    match = _ERROR_BODY_RE.search(error_str)
+    if not match:
+        return error_str
+
+    body = match.group(1)
+    try:
+        error_dict = json.loads(body)
+        if isinstance(error_dict, dict):
+            return str(error_dict.get("message", error_str))
+    except ValueError:
+        pass
+
+    message_match = _ERROR_MESSAGE_RE.search(body)
+    return message_match.group(2) if message_match else error_str
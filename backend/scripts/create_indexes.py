@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Create query-specific indexes on the league SQLite databases.
+
+The API opens the league databases read-only, so indexes have to be added
+ahead of time. Run this after refreshing any database file:
+
+    cd backend && python scripts/create_indexes.py
+
+Every statement uses IF NOT EXISTS, so the script is safe to re-run.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+DB_DIR = Path(__file__).parent.parent / "db"
+
+LEAGUE_INDEXES: dict[str, list[str]] = {
+    "cebl": [
+        # Shot chart queries (player_service.get_shot_chart_data*) only read shot attempts with coordinates
+        """
+        CREATE INDEX IF NOT EXISTS idx_pbp_player_shots ON play_by_play(player_name, season, period)
+        WHERE action_type IN ('2pt', '3pt') AND x IS NOT NULL AND y IS NOT NULL
+        """,
+        # get_shot_chart_data filters players by player_id, then probes idx_pbp_player_shots per (name, season)
+        "CREATE INDEX IF NOT EXISTS idx_players_player_id ON players(player_id)",
+        # Inner side of the play_by_play -> players join on (full_name, season)
+        "CREATE INDEX IF NOT EXISTS idx_players_name_season ON players(full_name, season)",
+    ],
+}
+
+
+def create_indexes(league: str, statements: list[str]) -> None:
+    """Apply index statements to a single league database."""
+    db_path = DB_DIR / f"{league}.db"
+    if not db_path.exists():
+        print(f"⚠️  Skipping {league}: database not found at {db_path}")
+        return
+
+    conn = sqlite3.connect(db_path)
+    try:
+        for statement in statements:
+            conn.execute(statement)
+        conn.commit()
+        print(f"✅ {league}: {len(statements)} index(es) ensured")
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    for league, statements in LEAGUE_INDEXES.items():
+        create_indexes(league, statements)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached/streamed stats paths against straightforward reference implementations.
+
+Covers:
+- HoopQueens mean/stddev (single-pass Welford loop) and bisect-based percentiles
+- TeamStats per-game averages (computed in SQL) for one team in each league
+- LLM response cache keys, hits, expiry and eviction
+
+Usage:
+    python tests/test_stats_caching.py
+
+Reads the bundled league databases in db/; no network access required.
+"""
+
+import statistics
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from app.db.sqlite import execute_query
+from app.services.stats_calculator import _calculate_percentile, calculate_league_specific_stats
+from app.services.team_service import TeamStats, get_team_stats
+from graph import llm_cache
+
+
+def print_section(title: str):
+    """Print formatted section header."""
+    print("\n" + "=" * 80)
+    print(f" {title}")
+    print("=" * 80)
+
+
+def print_test(test_name: str):
+    """Print test name."""
+    print(f"\n▶ Testing: {test_name}")
+
+
+def print_pass(message: str = "PASSED"):
+    """Print success message."""
+    print(f"  ✅ {message}")
+
+
+def print_fail(message: str):
+    """Print failure message."""
+    print(f"  ❌ FAILED: {message}")
+
+
+# ===== Reference implementations =====
+
+
+def reference_percentile(value: float, distribution: list[float]) -> int:
+    """Percentile rank by counting every value strictly below the player's value."""
+    count_below = sum(1 for v in distribution if v < value)
+    return round((count_below / len(distribution)) * 100)
+
+
+def reference_per_game(total, games_played) -> float | None:
+    """Per-game average the way the team service computed it before the division moved into SQL."""
+    total = float(total or 0)
+    return round(total / (games_played or 1), 1) if total else None
+
+
+def reference_team_stats(league: str, team: str, season: str) -> TeamStats | None:
+    """TeamStats built from raw season totals / box scores with the original Python per-game math."""
+    if league in ("usports", "ccaa"):
+        rows = execute_query(
+            league,
+            """
+            SELECT points_per_game as ppg, field_goal_attempted, free_throws_attempted, games_played,
+                   total_rebounds_per_game as rpg, assists_per_game as apg, turnovers_per_game as tov_per_game,
+                   steals_per_game as spg, blocks_per_game as bpg
+            FROM team_stats
+            WHERE team_name = ? AND season = ?
+            LIMIT 1
+            """,
+            (team, season),
+        )
+        if not rows:
+            return None
+        row = rows[0]
+        return TeamStats(
+            ppg=row["ppg"],
+            fga_per_game=reference_per_game(row["field_goal_attempted"], row["games_played"]),
+            fta_per_game=reference_per_game(row["free_throws_attempted"], row["games_played"]),
+            rpg=row["rpg"],
+            apg=row["apg"],
+            tov_per_game=row["tov_per_game"],
+            spg=row["spg"],
+            bpg=row["bpg"],
+        )
+
+    if league == "cebl":
+        rows = execute_query(
+            "cebl",
+            """
+            SELECT games_played, points_for, field_goals_attempted, free_throws_attempted,
+                   rebounds, assists, turn_overs, steals, blocks
+            FROM teams
+            WHERE name_en = ? AND season = ?
+            LIMIT 1
+            """,
+            (team, season),
+        )
+        if not rows:
+            return None
+        row = rows[0]
+        totals = ("points_for", "field_goals_attempted", "free_throws_attempted", "rebounds", "assists")
+        totals += ("turn_overs", "steals", "blocks")
+        return TeamStats(
+            *(reference_per_game(row[column], row["games_played"]) for column in totals),
+        )
+
+    # HoopQueens: average the team's box scores in Python
+    team_rows = execute_query("hoopqueens", "SELECT id FROM team WHERE name = ? LIMIT 1", (team,))
+    if not team_rows:
+        return None
+    games = execute_query(
+        "hoopqueens",
+        """
+        SELECT tb.*
+        FROM teamboxscore tb
+        JOIN game g ON tb.game_id = g.id
+        WHERE tb.team_id = ? AND g.season = ?
+        """,
+        (team_rows[0]["id"], int(season)),
+    )
+    if not games:
+        return None
+    columns = ("final_score", "field_goals_attempted", "free_throws_attempted", "total_rebounds", "assists")
+    columns += ("turnovers", "steals", "blocks")
+    averages = []
+    for column in columns:
+        values = [game[column] for game in games if game[column] is not None]
+        average = sum(values) / len(values) if values else None
+        averages.append(round(average, 1) if average else None)
+    return TeamStats(*averages)
+
+
+# ===== Test: stats_calculator =====
+
+
+def test_hoopqueens_mean_and_stddev():
+    """Test the single-pass PPG variance/consistency against statistics.mean/stdev."""
+    print_test("calculate_league_specific_stats() HoopQueens mean/stddev")
+
+    points = [12, 7, 22, 15, 0, 9, 31, 18, 18, 4]
+    plus_minus = [5, -3, 12, 0, -8, 2, 15, -1, 7, -4]
+    game_logs = [
+        {"points": p, "plus_minus": pm, "fouls_drawn": i % 4, "field_goals_attempted": 10 + i}
+        for i, (p, pm) in enumerate(zip(points, plus_minus, strict=True))
+    ]
+
+    stats = calculate_league_specific_stats("hoopqueens", game_logs=game_logs)
+
+    std_ppg = statistics.stdev(points)
+    expected = {
+        "ppg_variance": round(std_ppg, 1),
+        "consistency_score": round((std_ppg / statistics.mean(points)) * 100, 1),
+        "plus_minus": round(statistics.mean(plus_minus), 1),
+        "plus_minus_min": min(plus_minus),
+        "plus_minus_max": max(plus_minus),
+    }
+    actual = {field: getattr(stats, field) for field in expected}
+
+    if actual == expected:
+        print_pass(f"Matches reference: {actual}")
+        return True
+    print_fail(f"Expected {expected}, got {actual}")
+    return False
+
+
+def test_hoopqueens_single_game_has_no_variance():
+    """Test that a single game leaves the variance fields unset."""
+    print_test("calculate_league_specific_stats() HoopQueens single game")
+
+    stats = calculate_league_specific_stats("hoopqueens", game_logs=[{"points": 20, "plus_minus": 4}])
+
+    if stats.ppg_variance is None and stats.consistency_score is None:
+        print_pass("No variance for one game")
+        return True
+    print_fail(f"Expected None, got {stats.ppg_variance}, {stats.consistency_score}")
+    return False
+
+
+def test_percentile_matches_linear_count():
+    """Test the bisect percentile against a linear count, including ties and out-of-range values."""
+    print_test("_calculate_percentile() vs linear count")
+
+    distribution = sorted([3.2, 7.5, 7.5, 7.5, 10.0, 12.4, 15.1, 15.1, 21.8, 0.0, 4.4])
+    values = [-1.0, 0.0, 3.2, 7.5, 8.0, 15.1, 21.8, 30.0]
+
+    mismatches = [
+        (value, _calculate_percentile(value, distribution), reference_percentile(value, distribution))
+        for value in values
+        if _calculate_percentile(value, distribution) != reference_percentile(value, distribution)
+    ]
+
+    if not mismatches:
+        print_pass(f"{len(values)} values match")
+        return True
+    print_fail(f"(value, actual, expected) mismatches: {mismatches}")
+    return False
+
+
+# ===== Test: team_service =====
+
+
+def _latest_team(league: str) -> tuple[str, str] | None:
+    """First team (alphabetically) in the league's latest season."""
+    queries = {
+        "usports": "SELECT team_name as team, season FROM team_stats ORDER BY season DESC, team_name LIMIT 1",
+        "ccaa": "SELECT team_name as team, season FROM team_stats ORDER BY season DESC, team_name LIMIT 1",
+        "cebl": "SELECT name_en as team, season FROM teams ORDER BY season DESC, name_en LIMIT 1",
+        "hoopqueens": "SELECT name as team, (SELECT MAX(season) FROM game) as season FROM team ORDER BY name LIMIT 1",
+    }
+    rows = execute_query(league, queries[league])
+    return (rows[0]["team"], str(rows[0]["season"])) if rows else None
+
+
+def _test_team_stats(league: str):
+    """Compare get_team_stats with the reference per-game math for one team."""
+    print_test(f"get_team_stats() for {league}")
+
+    team_season = _latest_team(league)
+    if team_season is None:
+        print_fail(f"No teams found in {league} database")
+        return False
+
+    team, season = team_season
+    get_team_stats.cache_clear()
+    actual = get_team_stats(league, team, season)
+    expected = reference_team_stats(league, team, season)
+
+    if actual != expected:
+        print_fail(f"{team} {season}: expected {expected}, got {actual}")
+        return False
+
+    if get_team_stats(league, team, season) is not actual:
+        print_fail("Second call did not return the cached instance")
+        return False
+
+    print_pass(f"{team} {season}: {actual}")
+    return True
+
+
+def test_team_stats_usports():
+    return _test_team_stats("usports")
+
+
+def test_team_stats_ccaa():
+    return _test_team_stats("ccaa")
+
+
+def test_team_stats_cebl():
+    return _test_team_stats("cebl")
+
+
+def test_team_stats_hoopqueens():
+    return _test_team_stats("hoopqueens")
+
+
+# ===== Test: llm_cache =====
+
+
+class _Answer(BaseModel):
+    text: str
+
+
+class _OtherAnswer(BaseModel):
+    text: str
+    score: int = 0
+
+
+_MESSAGES = [SystemMessage(content="You are a scout."), HumanMessage(content="Summarize this player.")]
+
+
+def test_cache_key_inputs():
+    """Test that the key is stable and changes with model, messages and schema."""
+    print_test("make_cache_key() determinism")
+
+    key = llm_cache.make_cache_key("model-a", _MESSAGES, _Answer)
+    variants = {
+        "same inputs": llm_cache.make_cache_key("model-a", list(_MESSAGES), _Answer) == key,
+        "model": llm_cache.make_cache_key("model-b", _MESSAGES, _Answer) != key,
+        "messages": llm_cache.make_cache_key("model-a", _MESSAGES[:1], _Answer) != key,
+        "schema": llm_cache.make_cache_key("model-a", _MESSAGES, _OtherAnswer) != key,
+    }
+
+    if all(variants.values()):
+        print_pass("Key depends on model, messages and schema only")
+        return True
+    print_fail(f"Unexpected key behaviour: {variants}")
+    return False
+
+
+def test_cache_hit_and_expiry():
+    """Test hits return an equal copy and expired entries miss."""
+    print_test("get_cached_output() hit/expiry")
+
+    llm_cache.clear_llm_cache()
+    key = llm_cache.make_cache_key("model-a", _MESSAGES, _Answer)
+    output = _Answer(text="Strong rebounder")
+
+    if llm_cache.get_cached_output(key, _Answer) is not None:
+        print_fail("Hit on an empty cache")
+        return False
+
+    llm_cache.set_cached_output(key, output)
+    cached = llm_cache.get_cached_output(key, _Answer)
+    if cached != output or cached is output:
+        print_fail(f"Expected an equal copy of {output}, got {cached!r}")
+        return False
+
+    with patch("graph.llm_cache.time.monotonic", return_value=llm_cache._LLM_CACHE[key][0] + 1):
+        if llm_cache.get_cached_output(key, _Answer) is not None:
+            print_fail("Expired entry was returned")
+            return False
+
+    if key in llm_cache._LLM_CACHE:
+        print_fail("Expired entry was not removed")
+        return False
+
+    print_pass("Hit returns a copy; expired entry is dropped")
+    return True
+
+
+def test_cache_eviction():
+    """Test the oldest entry is evicted when the cache is full."""
+    print_test("set_cached_output() eviction")
+
+    llm_cache.clear_llm_cache()
+    with patch.object(llm_cache, "LLM_CACHE_MAX_ENTRIES", 2):
+        for i in range(3):
+            llm_cache.set_cached_output(f"key-{i}", _Answer(text=str(i)))
+        # Overwriting an existing key must not evict anything
+        llm_cache.set_cached_output("key-2", _Answer(text="updated"))
+
+    keys = list(llm_cache._LLM_CACHE)
+    llm_cache.clear_llm_cache()
+
+    if keys == ["key-1", "key-2"]:
+        print_pass("Oldest entry evicted, overwrite kept size")
+        return True
+    print_fail(f"Expected ['key-1', 'key-2'], got {keys}")
+    return False
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print_section("Stats & Caching Tests")
+
+    tests = [
+        # stats_calculator tests
+        ("HoopQueens Mean/Stddev", test_hoopqueens_mean_and_stddev),
+        ("HoopQueens Single Game", test_hoopqueens_single_game_has_no_variance),
+        ("Percentile vs Linear Count", test_percentile_matches_linear_count),
+        # team_service tests
+        ("Team Stats - U SPORTS", test_team_stats_usports),
+        ("Team Stats - CCAA", test_team_stats_ccaa),
+        ("Team Stats - CEBL", test_team_stats_cebl),
+        ("Team Stats - HoopQueens", test_team_stats_hoopqueens),
+        # llm_cache tests
+        ("LLM Cache - Key Inputs", test_cache_key_inputs),
+        ("LLM Cache - Hit/Expiry", test_cache_hit_and_expiry),
+        ("LLM Cache - Eviction", test_cache_eviction),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for _, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:  # noqa: BLE001 - report any crash as a failure and keep running
+            print_fail(f"Unexpected error: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    # Summary
+    print_section("Test Results")
+    total = passed + failed
+    print(f"Total Tests: {total}")
+    print(f"✅ Passed: {passed}")
+    print(f"❌ Failed: {failed}")
+    print(f"\nSuccess Rate: {(passed / total * 100):.1f}%\n")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    print("Starting Stats & Caching Tests...")
+    success = run_all_tests()
+    sys.exit(0 if success else 1)